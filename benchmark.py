@@ -0,0 +1,291 @@
+"""
+Frame-time benchmark for enemy crowds.
+
+Runs the arena headless with increasing zombie counts while the player walks
+a scripted path, and reports p50/p95/p99 frame time split by system.
+
+Usage:
+    python benchmark.py                               # run all scenarios
+    python benchmark.py --counts 5 50 --frames 300
+    python benchmark.py --output bench.json           # write results
+    python benchmark.py --compare baseline.json       # flag regressions
+    python benchmark.py --separation                  # crowd separation only
+"""
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import time as _time
+
+# Ursina calls __main__.update every frame; reuse the game's global hook
+from main import Game, update  # noqa: F401
+import game_state
+from config import SIMULATION_TICK_RATE
+
+
+DEFAULT_COUNTS = [5, 50, 500, 2000]
+DEFAULT_SEPARATION_COUNTS = [100, 1000, 5000]
+DEFAULT_FRAMES = 600
+DEFAULT_WARMUP = 30
+DEFAULT_THRESHOLD = 0.15          # 15% slower than baseline is a regression
+MIN_REGRESSION_MS = 0.05          # Ignore differences below timer noise
+
+# Scripted player path: circle around the arena center, inside the pillars
+PATH_RADIUS = 6
+PATH_ANGULAR_SPEED = 0.5          # radians per second
+
+REPORTED_LABELS = [
+    'frame', 'Game.update',
+    'phase.input', 'phase.ai', 'phase.movement', 'phase.combat',
+    'phase.animation', 'phase.ui',
+    'EnemyManager.interpolate', 'EnemyManager.animate', 'Player.move', 'HUD.refresh',
+]
+
+
+def scripted_player_position(frame, dt):
+    """Position and heading of the player on the scripted path."""
+    angle = frame * dt * PATH_ANGULAR_SPEED
+    x = math.cos(angle) * PATH_RADIUS
+    z = math.sin(angle) * PATH_RADIUS
+    heading = -math.degrees(angle)
+    return (x, 0, z), heading
+
+
+def run_scenario(enemy_count, frames, warmup):
+    """
+    Run one scenario in this process.
+
+    The player is kept at full health so the run never ends in game over.
+
+    Returns:
+        Dict of label -> timing stats in milliseconds
+    """
+    from core.headless import create_headless_app
+    from core.profiler import Profiler
+    from entities.player import Player
+    from systems.enemy_manager import EnemyManager
+    from ui.hud import HUD
+
+    app = create_headless_app()
+
+    profiler = Profiler()
+    profiler.instrument(Game)
+    profiler.instrument(EnemyManager, 'interpolate')
+    profiler.instrument(EnemyManager, 'animate')
+    profiler.instrument(Player, 'move')
+    profiler.instrument(HUD, 'refresh')
+
+    game = Game(headless=True)
+    game_state.game = game
+    game.start_game(enemy_count=enemy_count)
+
+    dt = 1 / SIMULATION_TICK_RATE
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            profiler.reset()
+
+        player = game.player
+        position, player.rotation_y = scripted_player_position(frame, dt)
+        player.teleport(position)
+        player.health = player.max_health
+
+        start = _time.perf_counter()
+        app.taskMgr.step()
+        profiler.add('frame', _time.perf_counter() - start)
+        for phase, seconds in game.scheduler.timings.items():
+            profiler.add(f'phase.{phase}', seconds)
+        profiler.end_frame()
+
+    profiler.restore()
+    return profiler.summary()
+
+
+def run_separation(agent_count, steps, warmup):
+    """
+    Time crowd separation steering on its own, without the engine.
+
+    Agents start spread over the arena and walk to its center while
+    separating, so the crowd gets denser as the run goes on.
+
+    Returns:
+        Timing stats in milliseconds for one steer() call over all agents
+    """
+    import numpy as np
+    from config import DEFAULT_LEVEL_SIZE
+    from core.profiler import Profiler
+    from systems.separation import Separation
+
+    rng = np.random.default_rng(0)
+    half = DEFAULT_LEVEL_SIZE / 2 - 1
+    xz = rng.uniform(-half, half, (agent_count, 2))
+    agents = np.arange(agent_count)
+    separation = Separation()
+    profiler = Profiler()
+    step_length = 2 / SIMULATION_TICK_RATE     # Zombie speed for one tick
+
+    for step in range(warmup + steps):
+        if step == warmup:
+            profiler.reset()
+
+        start = _time.perf_counter()
+        push = separation.steer(xz, agents)
+        profiler.add('steer', _time.perf_counter() - start)
+        profiler.end_frame()
+
+        heading = push - xz / np.maximum(np.linalg.norm(xz, axis=1), 1e-9)[:, None]
+        length = np.maximum(np.linalg.norm(heading, axis=1), 1e-9)[:, None]
+        xz += heading / length * step_length
+
+    return profiler.summary()['steer']
+
+
+def run_scenario_subprocess(enemy_count, frames, warmup):
+    """Run a scenario in a fresh interpreter so scenarios do not share state."""
+    cmd = [
+        sys.executable, __file__, '--run-scenario', str(enemy_count),
+        '--frames', str(frames), '--warmup', str(warmup),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    # Ursina and Panda3D may print to stdout; the result is the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    A label regresses when its p95 is more than `threshold` slower than the
+    baseline's and the difference is above timer noise.
+
+    Returns:
+        List of regression description strings
+    """
+    regressions = []
+    for count, labels in results['scenarios'].items():
+        base_labels = baseline.get('scenarios', {}).get(count)
+        if not base_labels:
+            continue
+        for label, stats in labels.items():
+            base = base_labels.get(label)
+            if not base:
+                continue
+            current, previous = stats['p95'], base['p95']
+            if current - previous < MIN_REGRESSION_MS:
+                continue
+            if current > previous * (1 + threshold):
+                regressions.append(
+                    f"{count} enemies, {label}: p95 {previous:.3f} -> {current:.3f} ms"
+                )
+    return regressions
+
+
+def print_report(results):
+    """Print a human-readable table of the results."""
+    for count, labels in results['scenarios'].items():
+        print(f"\n{count} enemies")
+        print(f"  {'section':<26}{'p50':>10}{'p95':>10}{'p99':>10}")
+        for label in REPORTED_LABELS:
+            stats = labels.get(label)
+            if stats:
+                print(
+                    f"  {label:<26}{stats['p50']:>10.3f}"
+                    f"{stats['p95']:>10.3f}{stats['p99']:>10.3f}"
+                )
+
+
+def print_separation_report(results):
+    """Print the separation benchmark table."""
+    print("\nSeparation steering (ms per step)")
+    print(f"  {'agents':<26}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for count, stats in results['separation'].items():
+        print(
+            f"  {count:<26}{stats['p50']:>10.3f}"
+            f"{stats['p95']:>10.3f}{stats['p99']:>10.3f}"
+        )
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Enemy crowd frame-time benchmark')
+    parser.add_argument('--counts', type=int, nargs='+',
+                        help='zombie (or --separation agent) counts to benchmark')
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES,
+                        help='measured frames per scenario')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP,
+                        help='frames to run before measuring')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare against a stored results file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed p95 slowdown before flagging (0.15 = 15%%)')
+    parser.add_argument('--separation', action='store_true',
+                        help='benchmark crowd separation alone (default counts 100 1000 5000)')
+    parser.add_argument('--run-scenario', type=int, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Benchmark entry point."""
+    args = parse_args(argv)
+
+    if args.run_scenario is not None:
+        stats = run_scenario(args.run_scenario, args.frames, args.warmup)
+        print(json.dumps(stats))
+        return 0
+
+    if args.separation:
+        counts = args.counts or DEFAULT_SEPARATION_COUNTS
+        results = {'separation': {}}
+        for count in counts:
+            print(f"Running separation with {count} agents...", flush=True)
+            results['separation'][str(count)] = run_separation(count, args.frames, args.warmup)
+        print_separation_report(results)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\nWrote {args.output}")
+        return 0
+
+    counts = args.counts or DEFAULT_COUNTS
+
+    results = {
+        'meta': {
+            'frames': args.frames,
+            'warmup': args.warmup,
+            'tick_rate': SIMULATION_TICK_RATE,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'scenarios': {},
+    }
+    for count in counts:
+        print(f"Running {count} enemies...", flush=True)
+        results['scenarios'][str(count)] = run_scenario_subprocess(
+            count, args.frames, args.warmup
+        )
+
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
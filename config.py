@@ -2,6 +2,7 @@
 Game Configuration Constants
 All game settings and tunable parameters in one place.
 """
+import os
 
 # =============================================================================
 # WINDOW SETTINGS
@@ -58,6 +59,7 @@ ENEMIES = {
         'scale': (1, 2, 1),  # Fallback cube scale
         'model_scale': 0.04,  # Scale for OBJ model (model is ~50 units tall)
         'model_height': 2.0,  # Height for health bar positioning
+        'hitbox': (0.8, 2.0, 0.8),  # Hitscan box for the 3D model (feet origin)
     },
     'demon': {
         'health': 100,
@@ -70,6 +72,7 @@ ENEMIES = {
         'scale': (1.5, 2.5, 1.5),
         'model_scale': 0.02,
         'model_height': 2.5,
+        'hitbox': (1.2, 2.5, 1.2),
     },
     'imp': {
         'health': 40,
@@ -106,6 +109,17 @@ CROSSHAIR_THICKNESS = 0.003
 DAMAGE_FLASH_INTENSITY = 0.4
 DAMAGE_FLASH_DURATION = 0.3
 
+# =============================================================================
+# EFFECTS SETTINGS
+# =============================================================================
+IMPACT_POOL_SIZE = 64          # Max sparks alive at once; oldest is reused
+IMPACT_LIFETIME = 0.2          # Seconds a spark takes to fade out
+IMPACT_SIZE = 0.1              # Spark size in world units
+IMPACT_COLOR = (1.0, 0.9, 0.1) # Yellow
+HEALTH_BAR_SIZE = (0.8, 0.08)  # Enemy health bar width, height in world units
+HEALTH_BAR_OFFSET_Y = 0.3      # Gap between the model top and its health bar
+HEALTH_BAR_DRAW_DISTANCE = 30  # Bars of farther enemies are not drawn
+
 # =============================================================================
 # LEVEL SETTINGS
 # =============================================================================
@@ -113,6 +127,113 @@ DEFAULT_LEVEL_SIZE = 50
 WALL_HEIGHT = 4
 WALL_THICKNESS = 1
 
+# =============================================================================
+# ASSET SETTINGS
+# =============================================================================
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+MODEL_DIR = os.path.join(PROJECT_ROOT, 'assets', 'models')
+MODEL_CACHE_DIR = 'assets/cache'   # Binary (.bam) model cache, keyed by content hash
+
+# =============================================================================
+# AUDIO SETTINGS
+# =============================================================================
+SOUND_CLIPS = {
+    'shotgun': 'assets/sounds/shotgun.wav',
+    'hit': 'assets/sounds/hit.wav',
+    'enemy_death': 'assets/sounds/enemy_death.wav',
+}
+SOUND_VOICES_PER_CLIP = 4      # Polyphony cap; the oldest voice is stolen
+
+# =============================================================================
+# SIMULATION SETTINGS
+# =============================================================================
+SIMULATION_TICK_RATE = 60      # Fixed gameplay steps per second (and headless frame rate)
+MAX_CATCH_UP_STEPS = 5         # Steps per frame before falling behind is accepted
+HEADLESS_FRAMES = 600          # Default frame count for --headless
+
+# =============================================================================
+# SPATIAL QUERY SETTINGS
+# =============================================================================
+SPATIAL_HASH_CELL_SIZE = 2.0   # World units per grid cell over the arena
+
+# =============================================================================
+# LINE OF SIGHT SETTINGS
+# =============================================================================
+ENEMY_SIGHT_REQUIRES_LOS = True    # Idle enemies only notice a player they can see
+ENEMY_NOTICE_TIMEOUT = 3.0         # Seconds in detection range before an unseen player is noticed anyway
+LOS_QUERIES_PER_STEP = 32          # Max fresh sight tests per fixed simulation step
+LOS_CACHE_TTL = 0.5                # Seconds a cached sight result stays valid
+LOS_EYE_HEIGHT = 1.5               # Sight line height above the feet
+
+# =============================================================================
+# VISIBILITY CULLING SETTINGS
+# =============================================================================
+ENEMY_VISIBILITY_CULLING = True    # Hide and stop animating enemies behind pillars
+OCCLUDER_MIN_HEIGHT = 3.0          # Floor-standing boxes this tall hide what is behind them
+OCCLUSION_MARGIN = 0.6             # Added to enemy half widths so arms never pop out
+
+# =============================================================================
+# NAVIGATION SETTINGS
+# =============================================================================
+NAV_CELL_SIZE = 1.0            # World units per navigation grid cell
+NAV_AGENT_RADIUS = 0.4         # Clearance kept from walls and pillars
+NAV_STEP_HEIGHT = 0.5          # Boxes lower than this (the floor) do not block
+NAV_BACKGROUND_THREAD = True   # Rebuild the flow field off the main thread
+
+# =============================================================================
+# CROWD SEPARATION SETTINGS
+# =============================================================================
+SEPARATION_RADIUS = 1.0        # Enemies closer than this push apart
+SEPARATION_WEIGHT = 1.5        # Push strength relative to the chase direction
+SEPARATION_CELL_SLOTS = 8      # Neighbours kept per grid cell
+
+# =============================================================================
+# AI LEVEL OF DETAIL SETTINGS
+# =============================================================================
+# (max distance to the player, update every N frames); the first matching tier wins
+AI_LOD_TIERS = [
+    (15, 1),
+    (30, 4),
+    (float('inf'), 16),
+]
+AI_LOD_UNSEEN_INTERVAL = 16    # Enemies behind the player, beyond the first tier
+AI_LOD_BEHIND_DOT = -0.2       # Facing dot product below which an enemy is behind
+
+# =============================================================================
+# ANIMATION SETTINGS
+# =============================================================================
+POSE_TABLE_SAMPLES = 4096      # Samples per state over one period of a pose table
+
+# =============================================================================
+# MESH LEVEL OF DETAIL SETTINGS
+# =============================================================================
+# (max distance to the player, vertex cluster size; None = full detail)
+MESH_LOD_LEVELS = [
+    (12, None),
+    (25, 0.04),
+    (float('inf'), 0.1),
+]
+MESH_LOD_HYSTERESIS = 1.5      # Distance past a boundary before switching level
+MESH_LOD_UV_CELL = 1 / 32      # Vertices in different UV cells are never merged
+
+# =============================================================================
+# PROFILER SETTINGS
+# =============================================================================
+PROFILER_ENABLED = False           # Time systems from startup (the overlay key also turns it on)
+PROFILER_WINDOW = 300              # Frames of rolling history kept per label
+PROFILER_OVERLAY_KEY = 'f3'        # Toggles the on-screen profiler overlay
+PROFILER_OVERLAY_INTERVAL = 0.25   # Seconds between overlay redraws
+PROFILER_HISTOGRAM_BINS = 8
+
+# =============================================================================
+# TRACE CAPTURE SETTINGS
+# =============================================================================
+TRACE_ENABLED = False          # Record trace events from startup (or pass --trace)
+TRACE_CAPACITY = 200000        # Ring buffer size in events (about 30 MB at most)
+TRACE_SECONDS = 30             # Seconds of history written per dump
+TRACE_DUMP_KEY = 'f4'          # Dumps the last TRACE_SECONDS (starts capture if off)
+TRACE_DIR = os.path.join(PROJECT_ROOT, 'traces')   # Dump directory
+
 # =============================================================================
 # GAME STATES
 # =============================================================================
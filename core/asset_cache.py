@@ -0,0 +1,103 @@
+"""
+Asset Cache
+Process-wide cache of models and textures shared between entities.
+"""
+from panda3d.core import NodePath
+
+
+class AssetCache:
+    """
+    Loads each model and texture once and hands out cheap instances.
+
+    Model instances are shallow copies of a cached prototype node: every
+    instance gets its own transform and render state (so tinting or
+    blinking one entity does not affect the others) while all of them
+    share the same vertex data on the CPU and GPU.
+    """
+
+    _models = {}
+    _textures = {}
+    _root = NodePath('asset_cache')
+
+    @classmethod
+    def model_instance(cls, name):
+        """
+        Get a new instance of a model.
+
+        Args:
+            name: Model name or path, as accepted by ursina's load_model
+
+        Returns:
+            NodePath sharing the cached geometry, or None if loading failed
+        """
+        prototype = cls._models.get(name)
+        if prototype is None:
+            from core.mesh_cache import load_model_cached
+            loaded = load_model_cached(name)
+            if not loaded:
+                return None
+            prototype = loaded.copyTo(cls._root)
+            cls._models[name] = prototype
+
+        return prototype.copyTo(cls._root)
+
+    @classmethod
+    def lod_instance(cls, name, cell_sizes):
+        """
+        Get a new instance of a model with all its levels of detail.
+
+        Args:
+            name: Model name or path, as accepted by ursina's load_model
+            cell_sizes: Cluster size of each level (None = full detail)
+
+        Returns:
+            NodePath with one child per level, in the order given (every
+            level shown; the caller stashes the unused ones), or None if
+            loading failed
+        """
+        key = (name, tuple(cell_sizes))
+        prototype = cls._models.get(key)
+        if prototype is None:
+            from core.mesh_lod import load_lod_model
+            prototype = cls._root.attachNewNode(f'{name}_lod')
+            for level, cell_size in enumerate(cell_sizes):
+                loaded = load_lod_model(name, cell_size)
+                if not loaded:
+                    prototype.removeNode()
+                    return None
+                loaded.copyTo(prototype).setName(f'lod{level}')
+            cls._models[key] = prototype
+
+        return prototype.copyTo(cls._root)
+
+    @classmethod
+    def texture(cls, path):
+        """
+        Get a texture, loading it on first use.
+
+        Args:
+            path: Texture path, as accepted by ursina's load_texture
+
+        Returns:
+            The cached Texture, or None if loading failed
+        """
+        if path not in cls._textures:
+            from ursina import load_texture
+            tex = load_texture(path)
+            if not tex:
+                return None
+            cls._textures[path] = tex
+        return cls._textures[path]
+
+    @classmethod
+    def clear(cls):
+        """
+        Evict all cached assets (call when a level unloads).
+
+        Instances already handed out keep their geometry alive until the
+        entities using them are destroyed.
+        """
+        for prototype in cls._models.values():
+            prototype.removeNode()
+        cls._models = {}
+        cls._textures = {}
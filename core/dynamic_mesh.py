@@ -0,0 +1,87 @@
+"""
+Dynamic Mesh
+Fixed-capacity vertex buffer that is rewritten from a NumPy array.
+"""
+import numpy as np
+from panda3d.core import (
+    Geom, GeomNode, GeomPoints, GeomTriangles, GeomVertexArrayFormat,
+    GeomVertexData, GeomVertexFormat, InternalName, NodePath,
+    OmniBoundingVolume
+)
+
+
+# x, y, z, r, g, b, a - all float32 so a (N, 7) array maps 1:1 onto the buffer
+VERTEX_COLUMNS = 7
+
+
+def _vertex_format():
+    array = GeomVertexArrayFormat()
+    array.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+    array.addColumn(InternalName.getColor(), 4, Geom.NT_float32, Geom.C_color)
+    return GeomVertexFormat.registerFormat(GeomVertexFormat(array))
+
+
+class DynamicMesh:
+    """
+    One Geom whose vertices are uploaded from `self.vertices` in a single copy.
+
+    Capacity is fixed at creation so the buffer is never reallocated. Unused
+    slots should be left fully transparent (points) or collapsed to zero
+    area (quads) so they draw nothing.
+    """
+
+    POINTS = 'points'
+    QUADS = 'quads'
+
+    _format = None
+
+    def __init__(self, name, capacity, primitive=POINTS):
+        """
+        Args:
+            name: Node name
+            capacity: Number of points, or number of quads
+            primitive: DynamicMesh.POINTS or DynamicMesh.QUADS
+        """
+        if DynamicMesh._format is None:
+            DynamicMesh._format = _vertex_format()
+
+        self.capacity = capacity
+        self.primitive = primitive
+        vertex_count = capacity * 4 if primitive == self.QUADS else capacity
+
+        # Staging array: edit this, then call upload()
+        self.vertices = np.zeros((vertex_count, VERTEX_COLUMNS), dtype=np.float32)
+
+        vdata = GeomVertexData(name, DynamicMesh._format, Geom.UH_dynamic)
+        vdata.uncleanSetNumRows(vertex_count)
+
+        if primitive == self.QUADS:
+            prim = GeomTriangles(Geom.UH_static)
+            prim.setIndexType(Geom.NT_uint32)
+            base = np.arange(capacity, dtype=np.uint32) * 4
+            indices = np.stack(
+                (base, base + 1, base + 2, base, base + 2, base + 3), axis=1
+            ).ravel()
+            index_array = prim.modifyVertices()
+            index_array.uncleanSetNumRows(len(indices))
+            memoryview(index_array).cast('B')[:] = indices.tobytes()
+        else:
+            prim = GeomPoints(Geom.UH_static)
+            prim.addConsecutiveVertices(0, vertex_count)
+
+        geom = Geom(vdata)
+        geom.addPrimitive(prim)
+
+        # Contents move every frame, so never cull on stale bounds
+        self.node = GeomNode(name)
+        self.node.addGeom(geom)
+        self.node.setBounds(OmniBoundingVolume())
+        self.node.setFinal(True)
+        self.node_path = NodePath(self.node)
+
+        self.upload()
+
+    def upload(self):
+        """Copy the staging array into the vertex buffer."""
+        array = self.node.modifyGeom(0).modifyVertexData().modifyArray(0)
+        memoryview(array).cast('B')[:] = self.vertices.tobytes()
@@ -0,0 +1,54 @@
+"""
+Fixed Timestep
+Accumulator that turns variable frame times into fixed simulation steps.
+"""
+from config import SIMULATION_TICK_RATE, MAX_CATCH_UP_STEPS
+
+
+class FixedTimestep:
+    """
+    Splits render frame time into whole simulation steps of equal length.
+
+    The leftover fraction of a step is exposed as `alpha` so rendering can
+    interpolate between the last two simulated states. After a long stall
+    at most `max_steps` steps run and the rest of the backlog is dropped,
+    so one slow frame cannot snowball into ever slower frames.
+    """
+
+    def __init__(self, tick_rate=SIMULATION_TICK_RATE, max_steps=MAX_CATCH_UP_STEPS):
+        self.step_dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0     # Seconds discarded by the catch-up cap
+
+    def advance(self, frame_dt):
+        """
+        Add a frame's time and take the whole steps now due.
+
+        Args:
+            frame_dt: Render frame time in seconds
+
+        Returns:
+            Number of fixed steps to run this frame
+        """
+        self.accumulator += frame_dt
+        # Small epsilon so a frame of exactly one step is not lost to rounding
+        steps = int((self.accumulator + 1e-9) / self.step_dt)
+
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.step_dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+
+        self.accumulator = max(0.0, self.accumulator - steps * self.step_dt)
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step since the last simulated state, in [0, 1)."""
+        return min(self.accumulator / self.step_dt, 1.0)
+
+    def reset(self):
+        """Drop any accumulated time."""
+        self.accumulator = 0.0
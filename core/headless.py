@@ -0,0 +1,97 @@
+"""
+Headless Runner
+Runs the game simulation without a visible window or audio device.
+"""
+import time as _time
+
+from panda3d.core import loadPrcFileData, ClockObject
+from config import SIMULATION_TICK_RATE
+
+
+def configure_headless():
+    """
+    Configure Panda3D for a window-less, silent run.
+
+    Must be called before the Ursina app is created. Uses the software
+    renderer so no GPU or display server is needed, and the null audio
+    library so no sound device is opened.
+    """
+    loadPrcFileData('', 'load-display p3tinydisplay')
+    loadPrcFileData('', 'aux-display p3tinydisplay')
+    loadPrcFileData('', 'audio-library-name null')
+    loadPrcFileData('', 'sync-video false')
+
+
+def _store_mouse_state_only():
+    """
+    Make mouse.locked / mouse.visible plain attributes.
+
+    Ursina applies them by requesting window properties, which an offscreen
+    buffer does not have. With no window there is no cursor to lock or hide,
+    so only the value is kept.
+    """
+    from ursina import mouse
+
+    mouse_class = type(mouse)
+
+    def set_locked(self, value):
+        self._locked = value
+
+    def set_visible(self, value):
+        self._visible = value
+
+    mouse_class.locked = property(mouse_class.locked.fget, set_locked)
+    mouse_class.visible = property(mouse_class.visible.fget, set_visible)
+
+
+def create_headless_app(tick_rate=SIMULATION_TICK_RATE):
+    """
+    Create an Ursina app with an inactive offscreen buffer and a fixed clock.
+
+    Args:
+        tick_rate: Simulation frames per second; every frame advances
+            time.dt by exactly 1 / tick_rate
+
+    Returns:
+        The Ursina application instance
+    """
+    configure_headless()
+
+    from ursina import Ursina
+    app = Ursina(
+        window_type='offscreen',
+        size=(64, 64),
+        development_mode=False
+    )
+
+    # Nothing is drawn: the buffer only exists so the scene graph is set up
+    if app.win:
+        app.win.setActive(False)
+    _store_mouse_state_only()
+
+    # Non-real-time clock: each frame advances by exactly one tick
+    clock = ClockObject.getGlobalClock()
+    clock.setMode(ClockObject.M_non_real_time)
+    clock.setFrameRate(tick_rate)
+
+    return app
+
+
+def run_frames(app, frames, on_frame=None):
+    """
+    Step the app a fixed number of frames.
+
+    Args:
+        app: Ursina application instance
+        frames: Number of frames to run
+        on_frame: Optional callback(frame_index) called before each frame
+
+    Returns:
+        Wall-clock seconds spent stepping
+    """
+    start = _time.perf_counter()
+    for frame in range(frames):
+        if on_frame:
+            on_frame(frame)
+        app.taskMgr.step()
+    return _time.perf_counter() - start
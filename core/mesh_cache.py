@@ -0,0 +1,132 @@
+"""
+Mesh Cache
+Converts text/GLB models to Panda3D's binary .bam format on first use.
+"""
+import hashlib
+import os
+from panda3d.core import Filename, Loader, LoaderOptions, NodePath
+from config import PROJECT_ROOT, MODEL_DIR, MODEL_CACHE_DIR
+
+
+SOURCE_EXTENSIONS = ('.obj', '.glb', '.gltf')
+
+
+def find_model_source(name):
+    """
+    Locate the source file for a model name.
+
+    Args:
+        name: Model name ('zombie_centered') or path with extension
+
+    Returns:
+        Absolute path to the source file, or None if not found
+    """
+    candidates = [name] if os.path.splitext(name)[1] else [
+        os.path.join(MODEL_DIR, name + ext) for ext in SOURCE_EXTENSIONS
+    ]
+    for path in candidates:
+        path = path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def content_hash(path):
+    """SHA-1 of a file's contents, so renamed or duplicate files share a cache entry."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path_for(source_path):
+    """Path of the .bam cache file for a source model."""
+    return os.path.join(PROJECT_ROOT, MODEL_CACHE_DIR, content_hash(source_path) + '.bam')
+
+
+def load_bam(path):
+    """Load a .bam file directly through Panda3D's loader (no text parsing)."""
+    options = LoaderOptions(LoaderOptions.LF_no_cache)
+    node = Loader.getGlobalPtr().loadSync(Filename.fromOsSpecific(path), options)
+    return NodePath(node) if node else None
+
+
+def parse_model_source(source_path):
+    """
+    Parse a source model file, with no caching of its own.
+
+    Uses the same parsers as ursina's load_model, but not load_model
+    itself: that reads and writes models_compressed/<name>.bam, a second
+    cache keyed only by file name that goes stale when the source changes.
+
+    Args:
+        source_path: Absolute path to a .obj, .glb or .gltf file
+
+    Returns:
+        NodePath of the model, or None if parsing failed
+    """
+    from pathlib import Path
+    directory, filename = os.path.split(source_path)
+    stem, ext = os.path.splitext(filename)
+    ext = ext.lower()
+
+    if ext == '.obj':
+        from ursina.mesh_importer import obj_to_ursinamesh
+        return obj_to_ursinamesh(path=Path(directory), name=stem, return_mesh=True)
+
+    if ext in ('.glb', '.gltf'):
+        import gltf
+        from ursina import application
+        settings = gltf.GltfSettings()
+        settings.no_srgb = application.gltf_no_srgb
+        return NodePath(gltf.load_model(source_path, gltf_settings=settings))
+
+    return None
+
+
+def load_model_cached(name):
+    """
+    Load a model, going through the binary cache.
+
+    The first load parses the source file (parse_model_source) and writes
+    the result as .bam keyed by the source's content hash; later loads
+    (including in later runs) read the .bam instead. Names with no source
+    under the project (e.g. ursina's built-in models) or in another format
+    fall back to ursina's load_model.
+
+    Args:
+        name: Model name or path, as accepted by ursina's load_model
+
+    Returns:
+        NodePath of the model, or None if loading failed
+    """
+    source = find_model_source(name)
+    if source:
+        bam_path = cache_path_for(source)
+        if os.path.isfile(bam_path):
+            try:
+                model = load_bam(bam_path)
+                if model:
+                    return model
+            except Exception as e:
+                print(f"Mesh cache read failed for {name}: {e}")
+
+    model = parse_model_source(source) if source else None
+    if model is None:
+        from ursina import load_model
+        model = load_model(name)
+    if not model:
+        return None
+
+    if source:
+        try:
+            # Write then rename so a crash never leaves a truncated cache file
+            os.makedirs(os.path.dirname(bam_path), exist_ok=True)
+            tmp_path = bam_path + '.tmp'
+            model.writeBamFile(Filename.fromOsSpecific(tmp_path))
+            os.replace(tmp_path, bam_path)
+        except Exception as e:
+            print(f"Mesh cache write failed for {name}: {e}")
+
+    return model
@@ -0,0 +1,236 @@
+"""
+Mesh LOD
+Vertex-clustering decimation of cached models into lower-detail levels.
+"""
+import os
+import numpy as np
+from panda3d.core import (
+    Filename, Geom, GeomTriangles, GeomVertexData, InternalName, NodePath
+)
+from core.mesh_cache import find_model_source, cache_path_for, load_bam, load_model_cached
+from config import MESH_LOD_UV_CELL
+
+
+def cluster_decimate(positions, uvs, normals, triangles, cell_size, uv_cell=MESH_LOD_UV_CELL):
+    """
+    Simplify a triangle mesh by merging all vertices that share a grid cell.
+
+    Vertices are also kept apart when their texture coordinates fall in
+    different UV cells, so seams between texture regions survive.
+    Triangles that collapse (two corners in one cluster) or duplicate
+    another triangle are dropped.
+
+    Args:
+        positions: (n, 3) vertex positions
+        uvs: (n, 2) texture coordinates
+        normals: (n, 3) vertex normals
+        triangles: (m, 3) vertex indices
+        cell_size: Cluster cell size in model units
+        uv_cell: Cluster cell size in texture space
+
+    Returns:
+        (positions, uvs, normals, triangles) of the simplified mesh
+    """
+    cells = np.floor(positions / cell_size).astype(np.int64)
+    uv_bins = np.floor(uvs / uv_cell).astype(np.int64)
+    keys = np.concatenate((cells, uv_bins), axis=1)
+    _, cluster, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    cluster = cluster.ravel()
+    count = len(counts)
+
+    def mean(values):
+        summed = np.stack([np.bincount(cluster, weights=values[:, k], minlength=count)
+                           for k in range(values.shape[1])], axis=1)
+        return summed / counts[:, None]
+
+    new_positions = mean(positions)
+    new_uvs = mean(uvs)
+    new_normals = mean(normals)
+    length = np.linalg.norm(new_normals, axis=1, keepdims=True)
+    np.divide(new_normals, length, out=new_normals, where=length > 0)
+
+    faces = cluster[triangles]
+    keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    faces = faces[keep]
+
+    # Same three clusters in any rotation is the same triangle
+    _, first = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+    faces = faces[np.sort(first)]
+
+    # Drop clusters no triangle uses
+    used, faces = np.unique(faces, return_inverse=True)
+    faces = faces.reshape(-1, 3)
+    return new_positions[used], new_uvs[used], new_normals[used], faces
+
+
+def _column(vdata, name):
+    """(rows, width) float32 copy of a vertex column stored in its own array."""
+    internal = InternalName.make(name)
+    fmt = vdata.getFormat()
+    array_index = fmt.getArrayWith(internal)
+    column = fmt.getColumn(internal)
+    array = vdata.getArray(array_index)
+    stride = fmt.getArray(array_index).getStride()
+    raw = np.frombuffer(memoryview(array), dtype=np.uint8).reshape(-1, stride)
+    start = column.getStart()
+    width = column.getNumComponents()
+    return raw[:, start:start + width * 4].copy().view(np.float32).reshape(-1, width)
+
+
+def _set_column(vdata, name, values):
+    """Write a vertex column stored alone in its own array."""
+    fmt = vdata.getFormat()
+    array_index = fmt.getArrayWith(InternalName.make(name))
+    array = vdata.modifyArray(array_index)
+    memoryview(array).cast('B')[:] = np.ascontiguousarray(values, dtype=np.float32).tobytes()
+
+
+def _triangle_indices(primitive):
+    """(m, 3) vertex indices of a GeomTriangles."""
+    primitive = primitive.decompose()
+    if not primitive.isIndexed():
+        start = primitive.getFirstVertex()
+        return np.arange(start, start + primitive.getNumVertices()).reshape(-1, 3)
+    dtype = {1: np.uint8, 2: np.uint16, 4: np.uint32}[primitive.getIndexStride()]
+    return np.frombuffer(memoryview(primitive.getVertices()), dtype=dtype).astype(np.int64).reshape(-1, 3)
+
+
+def decimate_geom(geom, cell_size):
+    """
+    Simplified copy of a triangle Geom with vertex, texcoord and normal columns.
+
+    Args:
+        geom: Source Geom
+        cell_size: Cluster cell size in model units
+
+    Returns:
+        New Geom, or None if the geom has no triangles or other columns
+    """
+    vdata = geom.getVertexData()
+    fmt = vdata.getFormat()
+    names = ('vertex', 'texcoord', 'normal')
+    # Only the plain layout the OBJ loader produces: one column per array
+    if (fmt.getNumArrays() != len(names) or fmt.getNumColumns() != len(names)
+            or not all(fmt.hasColumn(InternalName.make(n)) for n in names)):
+        return None
+
+    triangles = [_triangle_indices(geom.getPrimitive(i)) for i in range(geom.getNumPrimitives())
+                 if isinstance(geom.getPrimitive(i), GeomTriangles)]
+    if not triangles:
+        return None
+
+    positions, uvs, normals, faces = cluster_decimate(
+        _column(vdata, 'vertex'), _column(vdata, 'texcoord'), _column(vdata, 'normal'),
+        np.concatenate(triangles), cell_size
+    )
+
+    new_vdata = GeomVertexData(vdata.getName(), fmt, Geom.UH_static)
+    new_vdata.uncleanSetNumRows(len(positions))
+    _set_column(new_vdata, 'vertex', positions)
+    _set_column(new_vdata, 'texcoord', uvs)
+    _set_column(new_vdata, 'normal', normals)
+
+    primitive = GeomTriangles(Geom.UH_static)
+    primitive.setIndexType(Geom.NT_uint32)
+    indices = primitive.modifyVertices()
+    indices.uncleanSetNumRows(faces.size)
+    memoryview(indices).cast('B')[:] = faces.astype(np.uint32).tobytes()
+
+    new_geom = Geom(new_vdata)
+    new_geom.addPrimitive(primitive)
+    return new_geom
+
+
+def decimate_model(model, cell_size):
+    """
+    Simplified copy of a model; every decimatable Geom is replaced.
+
+    Args:
+        model: NodePath of the source model (left untouched)
+        cell_size: Cluster cell size in model units
+
+    Returns:
+        New NodePath sharing render states with the source
+    """
+    copy = model.copyTo(NodePath())
+    for node_path in copy.findAllMatches('**/+GeomNode'):
+        node = node_path.node()
+        for i in range(node.getNumGeoms()):
+            simplified = decimate_geom(node.getGeom(i), cell_size)
+            if simplified is not None:
+                node.setGeom(i, simplified)
+    return copy
+
+
+def load_lod_model(name, cell_size):
+    """
+    Load one LOD of a model, decimating and caching it on first use.
+
+    The level is stored next to the full-detail model in the .bam cache,
+    keyed by the source's content hash and the cell size, so it is built
+    once per machine.
+
+    Args:
+        name: Model name or path, as accepted by load_model_cached
+        cell_size: Cluster cell size, or None for the full-detail model
+
+    Returns:
+        NodePath of the level, or None if loading failed
+    """
+    model = load_model_cached(name)
+    if not model or cell_size is None:
+        return model
+
+    source = find_model_source(name)
+    bam_path = None
+    if source:
+        bam_path = cache_path_for(source).replace('.bam', f'_lod{cell_size:g}.bam')
+        if os.path.isfile(bam_path):
+            try:
+                level = load_bam(bam_path)
+                if level:
+                    return level
+            except Exception as e:
+                print(f"LOD cache read failed for {name}: {e}")
+
+    level = decimate_model(model, cell_size)
+
+    if bam_path:
+        try:
+            # Write then rename so a crash never leaves a truncated cache file
+            tmp_path = bam_path + '.tmp'
+            level.writeBamFile(Filename.fromOsSpecific(tmp_path))
+            os.replace(tmp_path, bam_path)
+        except Exception as e:
+            print(f"LOD cache write failed for {name}: {e}")
+
+    return level
+
+
+def geometry_stats(root):
+    """
+    Geometry that would be drawn under a node.
+
+    Stashed and hidden nodes are left out, so switched-off LOD levels do
+    not count.
+
+    Args:
+        root: NodePath to measure (e.g. render)
+
+    Returns:
+        Dict with 'geom_nodes', 'geoms', 'vertices' and 'triangles'
+    """
+    stats = {'geom_nodes': 0, 'geoms': 0, 'vertices': 0, 'triangles': 0}
+    for node_path in root.findAllMatches('**/+GeomNode'):
+        if node_path.isHidden():
+            continue
+        node = node_path.node()
+        stats['geom_nodes'] += 1
+        for i in range(node.getNumGeoms()):
+            geom = node.getGeom(i)
+            stats['geoms'] += 1
+            stats['vertices'] += geom.getVertexData().getNumRows()
+            stats['triangles'] += sum(
+                geom.getPrimitive(k).getNumFaces() for k in range(geom.getNumPrimitives())
+            )
+    return stats
@@ -0,0 +1,164 @@
+"""
+Profiler
+Per-frame timing of instrumented methods and named sections.
+"""
+import collections
+import functools
+import time as _time
+
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values sorted ascending
+        pct: Percentile in the range 0-100
+
+    Returns:
+        The percentile value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Profiler:
+    """
+    Accumulates time per label within a frame and keeps per-frame samples.
+
+    With a window, only the latest `window` frames are kept per label, so a
+    profiler can run for a whole session and its statistics stay rolling.
+    """
+
+    def __init__(self, window=None):
+        """
+        Args:
+            window: Frames of samples kept per label (None keeps every frame)
+        """
+        self.window = window
+        self.samples = {}       # label -> per-frame milliseconds (oldest first)
+        self._frame = {}        # label -> seconds accumulated this frame
+        self._patched = []      # (cls, method_name, original) for restore()
+        self.tracer = None      # Tracer also given begin/end events of timed calls
+
+    def _series(self, label):
+        """Sample sequence of a label, created on first use."""
+        values = self.samples.get(label)
+        if values is None:
+            values = collections.deque(maxlen=self.window) if self.window else []
+            self.samples[label] = values
+        return values
+
+    @property
+    def instrumented(self):
+        """True while any instrument() wrapper is installed."""
+        return bool(self._patched)
+
+    def instrument(self, cls, method_name='update', label=None):
+        """
+        Wrap a method defined on a class so every call is timed.
+
+        Only the method defined directly on the class is wrapped, so a
+        subclass calling super() is attributed to both labels. While
+        self.tracer is set, each call is also recorded as a trace event.
+
+        Args:
+            cls: Class owning the method
+            method_name: Name of the method to wrap
+            label: Label to record under (default 'Class.method')
+        """
+        original = cls.__dict__.get(method_name)
+        if original is None:
+            return
+
+        label = label or f'{cls.__name__}.{method_name}'
+        self._series(label)
+        frame = self._frame
+        profiler = self
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            tracer = profiler.tracer
+            if tracer:
+                tracer.begin(label)
+            start = _time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                frame[label] = frame.get(label, 0.0) + _time.perf_counter() - start
+                if tracer:
+                    tracer.end(label)
+
+        setattr(cls, method_name, timed)
+        self._patched.append((cls, method_name, original))
+
+    def restore(self):
+        """Undo all instrument() calls."""
+        for cls, method_name, original in reversed(self._patched):
+            setattr(cls, method_name, original)
+        self._patched = []
+
+    def add(self, label, seconds):
+        """Add time to a label for the current frame."""
+        self._series(label)
+        self._frame[label] = self._frame.get(label, 0.0) + seconds
+
+    def end_frame(self):
+        """Close the current frame, recording 0 for labels that did not run."""
+        for label, values in self.samples.items():
+            values.append(self._frame.get(label, 0.0) * 1000)
+        self._frame.clear()
+
+    def reset(self):
+        """Drop all recorded samples (e.g. after warmup frames)."""
+        for values in self.samples.values():
+            values.clear()
+        self._frame.clear()
+
+    def summary(self, percentiles=(50, 95, 99)):
+        """
+        Summarize recorded samples.
+
+        Returns:
+            Dict of label -> {'p50': ms, ..., 'mean': ms, 'max': ms}
+        """
+        result = {}
+        for label, values in self.samples.items():
+            ordered = sorted(values)
+            stats = {f'p{p}': percentile(ordered, p) for p in percentiles}
+            stats['mean'] = sum(ordered) / len(ordered) if ordered else 0.0
+            stats['max'] = ordered[-1] if ordered else 0.0
+            result[label] = stats
+        return result
+
+    def latest(self):
+        """
+        Milliseconds per label in the last closed frame.
+
+        Returns:
+            Dict of label -> ms (labels with no frames yet are left out)
+        """
+        return {label: values[-1] for label, values in self.samples.items() if values}
+
+    def histogram(self, label, bins=8, upper=None):
+        """
+        Distribution of a label's recorded frame times.
+
+        Args:
+            label: Label to bin
+            bins: Number of equal-width bins
+            upper: Top of the last bin in ms (default: the largest sample);
+                larger samples are counted in the last bin
+
+        Returns:
+            (counts, edges): `bins` counts and `bins + 1` bin edges in ms
+        """
+        values = self.samples.get(label) or ()
+        upper = upper if upper is not None else max(values, default=0.0)
+        width = upper / bins if upper > 0 else 1.0
+        counts = [0] * bins
+        for value in values:
+            counts[min(int(value / width), bins - 1)] += 1
+        return counts, [i * width for i in range(bins + 1)]
@@ -0,0 +1,104 @@
+"""
+Trace
+Ring buffer of begin/end events, exported as Chrome trace-event JSON.
+"""
+import collections
+import json
+import os
+import threading
+import time as _time
+from config import TRACE_CAPACITY, TRACE_SECONDS
+
+
+class Tracer:
+    """
+    Records nested begin/end events into a fixed-size ring buffer.
+
+    Memory stays bounded however long a session runs: once `capacity`
+    events are stored the oldest are dropped. dump() writes the last few
+    seconds in the Chrome trace-event format, which chrome://tracing and
+    ui.perfetto.dev open directly.
+
+    Recording is off until `enabled` is set; begin() and end() are then a
+    clock read and a deque append.
+    """
+
+    def __init__(self, capacity=TRACE_CAPACITY):
+        """
+        Args:
+            capacity: Maximum number of events kept
+        """
+        self.enabled = False
+        self.events = collections.deque(maxlen=capacity)   # (ph, name, seconds, thread id)
+
+    def begin(self, name):
+        """Open an event on the calling thread."""
+        if self.enabled:
+            self.events.append(('B', name, _time.perf_counter(), threading.get_ident()))
+
+    def end(self, name):
+        """Close the calling thread's innermost open event."""
+        if self.enabled:
+            self.events.append(('E', name, _time.perf_counter(), threading.get_ident()))
+
+    def clear(self):
+        """Drop all recorded events."""
+        self.events.clear()
+
+    def trace_events(self, seconds=None):
+        """
+        Recorded events as Chrome trace-event dicts.
+
+        Events are kept balanced per thread: ends whose begin fell out of
+        the buffer or the time window are dropped, and events still open
+        are closed at the last recorded time.
+
+        Args:
+            seconds: Only events from the last this many seconds (None for all)
+
+        Returns:
+            List of dicts with name, ph, ts (microseconds), pid and tid
+        """
+        events = list(self.events)
+        if not events:
+            return []
+        last = events[-1][2]
+        start = last - seconds if seconds is not None else float('-inf')
+
+        result = []
+        open_events = {}        # thread id -> names of its open events
+        for ph, name, when, thread in events:
+            if when < start:
+                continue
+            stack = open_events.setdefault(thread, [])
+            if ph == 'B':
+                stack.append(name)
+            elif stack:
+                name = stack.pop()
+            else:
+                continue
+            result.append({'name': name, 'ph': ph, 'ts': when * 1e6, 'pid': os.getpid(), 'tid': thread})
+
+        for thread, stack in open_events.items():
+            for name in reversed(stack):
+                result.append({'name': name, 'ph': 'E', 'ts': last * 1e6, 'pid': os.getpid(), 'tid': thread})
+        return result
+
+    def dump(self, path, seconds=TRACE_SECONDS):
+        """
+        Write the last seconds of events to a trace-event JSON file.
+
+        Args:
+            path: Output file; missing directories are created
+            seconds: Length of the window to write (None for everything)
+
+        Returns:
+            Number of events written
+        """
+        events = self.trace_events(seconds)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(events)
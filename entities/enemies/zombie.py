@@ -4,9 +4,37 @@ Slow melee enemy that chases and attacks the player.
 """
 import math
 import random
+import numpy as np
 from ursina import Entity, Vec3, color, time, destroy
-from entities.enemy import Enemy
-from config import ENEMIES
+from entities.enemy import Enemy, EnemyState
+from systems.enemy_manager import STATE_NAMES, STATE_CODES, STATE_IDLE
+from systems.pose_animation import PoseTable, BOB, PITCH, ROLL, YAW
+from config import ENEMIES, MESH_LOD_LEVELS
+
+
+# Procedural body animation for the 3D model (no skeleton): phase in radians
+# -> (bob, lean forward, sway, yaw offset). Yaw includes +180 because the
+# model faces backward.
+def _idle_pose(w):
+    """Breathing bob, gentle sway and a slow look around."""
+    return np.sin(w * 0.8) * 0.02, np.sin(w * 0.5) * 2, np.sin(w) * 2, 180 + np.sin(w * 0.3)
+
+
+def _chase_pose(w):
+    """Shamble: stepping bob, forward lean, side sway and wobble."""
+    return np.sin(w * 2) * 0.08, 8 + np.sin(w * 2) * 3, np.sin(w) * 4, 180 + np.sin(w * 0.7) * 3
+
+
+def _attack_pose(w):
+    """Lunge: aggressive lean and quick side movement."""
+    return np.abs(np.sin(w)) * 0.1, 15 + np.sin(w) * 10, np.sin(w * 2) * 5, 180
+
+
+_POSE_CURVES = {
+    EnemyState.IDLE: (_idle_pose, 1.5),
+    EnemyState.CHASE: (_chase_pose, 6),
+    EnemyState.ATTACK: (_attack_pose, 10),
+}
 
 
 class Zombie(Enemy):
@@ -26,6 +54,13 @@ class Zombie(Enemy):
         (0.95, 0.9, 1.0),  # Purple tint
     ]
 
+    # Walk/attack/idle curves by state code; every curve repeats over 20 pi
+    POSES = PoseTable(
+        [_POSE_CURVES[name][0] for name in STATE_NAMES],
+        [_POSE_CURVES[name][1] for name in STATE_NAMES],
+        period=20 * math.pi,
+    )
+
     # Scale variations
     SCALE_VARIANTS = [
         1.0,    # Normal
@@ -52,6 +87,10 @@ class Zombie(Enemy):
             variant_id = random.randint(0, len(self.SCALE_VARIANTS) - 1)
         self.variant_id = variant_id
 
+        # Levels of detail of the 3D model; EnemyManager picks one by distance
+        self.lod_nodes = []
+        self.mesh_lod = 0
+
         # Try to load 3D model
         self.using_3d_model = self._try_load_glb_model(config)
 
@@ -60,16 +99,22 @@ class Zombie(Enemy):
             self.model = 'cube'
             self.scale = (0.5, 2, 0.5)
             self.color = color.rgb(100, 140, 100)  # Green for zombie
+            self.hitbox_size = (0.5, 2, 0.5)
+        else:
+            # Model origin is at the feet
+            base_scale = self.SCALE_VARIANTS[self.variant_id % len(self.SCALE_VARIANTS)]
+            self.hitbox_size = tuple(s * base_scale for s in config['hitbox'])
+            self.hitbox_offset_y = self.hitbox_size[1] / 2
 
-        # Set up collider
-        self.collider = 'box'
+        # No ursina collider: shots and movement probes test the hitbox
+        # analytically (Hitscan), so the scene's raycasts skip the crowd
 
         # Animation state
         self.anim_time = 0
         self.walk_cycle = 0  # For walking animation
 
         # Animation tracking
-        self.target_rotation_y = 180  # Store the direction we should face
+        self.heading = 0  # Compass heading to face; the pose adds the model's 180
         self._current_bob = 0  # Track current vertical bob offset
 
         # No separate arm entities - model already has arms in T-pose
@@ -80,17 +125,22 @@ class Zombie(Enemy):
     def _try_load_glb_model(self, config):
         """Try to load the OBJ model with variant modifications."""
         try:
-            from ursina import load_model, load_texture
+            from core.asset_cache import AssetCache
 
             # Select model variant
             model_name = self.ZOMBIE_VARIANTS[0]  # Currently only one model
 
-            # Load the OBJ model using just the name (Ursina searches asset folders)
-            loaded_model = load_model(model_name, use_deepcopy=True)
+            # Instance of the shared model and its decimated levels
+            loaded_model = AssetCache.lod_instance(model_name, [cell for _, cell in MESH_LOD_LEVELS])
 
             if loaded_model:
                 self.model = loaded_model
 
+                # Full detail until the first switch
+                self.lod_nodes = list(loaded_model.getChildren())
+                for node in self.lod_nodes[1:]:
+                    node.stash()
+
                 # Apply scale variant
                 base_scale = self.SCALE_VARIANTS[self.variant_id % len(self.SCALE_VARIANTS)]
                 self.scale = base_scale
@@ -98,7 +148,7 @@ class Zombie(Enemy):
 
                 # Always apply texture - don't use color tint as it overrides texture
                 try:
-                    tex = load_texture('assets/models/peopleColors.png')
+                    tex = AssetCache.texture('assets/models/peopleColors.png')
                     if tex:
                         self.texture = tex
                     else:
@@ -222,86 +272,48 @@ class Zombie(Enemy):
     def update(self):
         """Update with smooth walking animation."""
         super().update()
+        self.animate_step(time.dt)
+
+    def tick(self, dt):
+        """Manager-driven update: walking animation (for zombies without a pose table)."""
+        super().tick(dt)
+        self.animate_step(dt)
 
-        # Animate based on model type
+    def animate_step(self, dt):
+        """Advance the animation by dt, based on model type."""
         if self.is_alive:
             if self.using_3d_model:
-                self._animate_3d_model()
+                self._animate_3d_model(dt)
             elif hasattr(self, 'left_leg'):
-                self._animate()
+                self._animate(dt)
 
-    def _animate_3d_model(self):
-        """Procedural walking animation for 3D model (no skeleton)."""
-        from entities.enemy import EnemyState
+    @property
+    def pose_table(self):
+        """PoseTable EnemyManager animates this zombie with (None for the primitive model)."""
+        return self.POSES if self.using_3d_model else None
+
+    def _animate_3d_model(self, dt):
+        """Procedural walking animation for 3D model (no skeleton), from the pose table."""
+        code = STATE_CODES.get(self.state, STATE_IDLE)
+        self.walk_cycle = float(self.POSES.advance(self.walk_cycle, code, dt))
+        pose = self.POSES.sample(self.walk_cycle, code)
 
         # Get base Y position (current Y minus any bob we applied)
         base_y = self.y - self._current_bob
+        self._current_bob = float(pose[BOB])
 
-        if self.state == EnemyState.CHASE:
-            # Walking/shambling animation
-            self.walk_cycle += time.dt * 6  # Walking speed
-
-            # Vertical bob - simulates stepping
-            new_bob = math.sin(self.walk_cycle * 2) * 0.08
-            self.y = base_y + new_bob
-            self._current_bob = new_bob
-
-            # Side-to-side sway - zombie shamble
-            sway = math.sin(self.walk_cycle) * 4
-            self.rotation_z = sway
-
-            # Forward lean while walking
-            lean = 8 + math.sin(self.walk_cycle * 2) * 3
-            self.rotation_x = lean
-
-            # Face target with subtle wobble
-            wobble = math.sin(self.walk_cycle * 0.7) * 3
-            self.rotation_y = self.target_rotation_y + wobble
-
-        elif self.state == EnemyState.ATTACK:
-            # Attack animation - lunge forward
-            self.walk_cycle += time.dt * 10
-
-            # Aggressive forward lean
-            attack_lean = 15 + math.sin(self.walk_cycle) * 10
-            self.rotation_x = attack_lean
-
-            # Quick side movement during attack
-            self.rotation_z = math.sin(self.walk_cycle * 2) * 5
-
-            # Bob during attack
-            new_bob = abs(math.sin(self.walk_cycle)) * 0.1
-            self.y = base_y + new_bob
-            self._current_bob = new_bob
-
-            # Face target
-            self.rotation_y = self.target_rotation_y
-
-        else:  # IDLE
-            # Subtle idle animation - breathing/swaying
-            self.walk_cycle += time.dt * 1.5
-
-            # Gentle sway
-            sway = math.sin(self.walk_cycle) * 2
-            self.rotation_z = sway
-
-            # Slight breathing bob
-            new_bob = math.sin(self.walk_cycle * 0.8) * 0.02
-            self.y = base_y + new_bob
-            self._current_bob = new_bob
-
-            # Reset lean
-            self.rotation_x = math.sin(self.walk_cycle * 0.5) * 2
-
-            # Idle facing with subtle variation
-            self.rotation_y = self.target_rotation_y + math.sin(self.walk_cycle * 0.3) * 1
+        # Ursina rotation (x, y, z) is Panda's HPR (-y, -x, z)
+        self.setPosHpr(
+            self.x, base_y + self._current_bob, self.z,
+            -(self.heading + pose[YAW]), -pose[PITCH], pose[ROLL]
+        )
 
-    def _animate(self):
+    def _animate(self, dt):
         """Smooth zombie shamble animation."""
         from entities.enemy import EnemyState
 
         if self.state == EnemyState.CHASE:
-            self.anim_time += time.dt * 5
+            self.anim_time += dt * 5
 
             # Leg walking motion
             leg_swing = math.sin(self.anim_time) * 30
@@ -320,7 +332,7 @@ class Zombie(Enemy):
             self.rotation_z = math.sin(self.anim_time * 0.5) * 3
 
         elif self.state == EnemyState.ATTACK:
-            self.anim_time += time.dt * 8
+            self.anim_time += dt * 8
 
             # Attack lunge
             lunge = abs(math.sin(self.anim_time)) * 40
@@ -328,7 +340,7 @@ class Zombie(Enemy):
             self.right_arm.rotation_x = 45 + lunge
 
         else:  # IDLE
-            self.anim_time += time.dt * 2
+            self.anim_time += dt * 2
 
             # Subtle breathing/swaying
             sway = math.sin(self.anim_time) * 2
@@ -341,27 +353,27 @@ class Zombie(Enemy):
                 self.left_arm.rotation_x = 45
                 self.right_arm.rotation_x = 45
 
-    def look_at_target(self):
-        """Override to store target rotation without resetting animation rotations."""
-        if not self.target:
+    def set_mesh_lod(self, level):
+        """
+        Show one level of detail of the 3D model.
+
+        Args:
+            level: Index into MESH_LOD_LEVELS (0 = full detail)
+        """
+        if level == self.mesh_lod or not self.lod_nodes:
             return
+        self.lod_nodes[self.mesh_lod].stash()
+        self.lod_nodes[level].unstash()
+        self.mesh_lod = level
 
-        # Calculate angle to target
-        direction = self.target.position - self.position
-        direction.y = 0
-
-        if direction.length() > 0:
-            # Calculate the Y rotation needed to face target
-            import math as m
-            angle = m.atan2(direction.x, direction.z)
-            self.target_rotation_y = m.degrees(angle) + 180  # +180 because model faces backward
-
-            # For 3D model, we apply rotation in the animation method
-            # For primitive model, use standard look_at
-            if not self.using_3d_model:
-                self.look_at(self.position + direction)
-                self.rotation_x = 0
-                self.rotation_z = 0
+    def face_heading(self, heading):
+        """Override to store the heading without resetting animation rotations."""
+        self.heading = heading
+
+        # For 3D model, we apply rotation in the animation method
+        # For primitive model, face the heading directly
+        if not self.using_3d_model:
+            super().face_heading(heading)
 
     def perform_attack(self):
         """Zombie melee attack."""
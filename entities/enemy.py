@@ -2,7 +2,9 @@
 Base Enemy Class
 Enemy with AI state machine: IDLE -> CHASE -> ATTACK.
 """
-from ursina import Entity, Vec3, time, destroy, invoke, color, distance, Audio
+import math
+from ursina import Vec3, time, destroy, invoke, color, distance
+import game_state
 from entities.base_entity import BaseGameEntity
 from config import ENEMIES, GameState
 
@@ -35,7 +37,6 @@ class Enemy(BaseGameEntity):
                 color=color.rgb(*[int(c * 255) for c in config['color']]),
                 position=position,
                 scale=config['scale'],
-                collider='box',
                 max_health=config['health'],
                 **kwargs
             )
@@ -61,40 +62,28 @@ class Enemy(BaseGameEntity):
         self.target = None
         self.time_since_attack = self.attack_cooldown
 
-        # Store config for health bar positioning
+        # Set by EnemyManager when this enemy's AI is batched
+        self.manager = None
+        self.manager_index = -1
+
+        # Height of the model top, where EnemyManager's health bar is drawn
         self.model_height = config.get('model_height', config['scale'][1])
 
-        # Health bar above enemy - not parented to avoid scale issues
-        self.health_bar_bg = Entity(
-            model='quad',
-            color=color.dark_gray,
-            scale=(0.8, 0.08),  # Smaller health bar
-            billboard=True
-        )
-        self.health_bar = Entity(
-            parent=self.health_bar_bg,
-            model='quad',
-            color=color.red,
-            scale=(0.95, 0.7),
-            z=-0.01
-        )
+        # Hitscan box: defaults to the (centered) cube model's size
+        self.hitbox_size = tuple(config['scale'])
+        self.hitbox_offset_y = 0
 
     def update(self):
         """Update enemy AI each frame."""
-        # Update health bar position above enemy
-        if self.health_bar_bg:
-            self.health_bar_bg.position = (
-                self.position.x,
-                self.position.y + self.model_height + 0.3,
-                self.position.z
-            )
-
         if not self.is_alive:
             return
 
+        # AI runs batched in EnemyManager
+        if self.manager:
+            return
+
         # Check game state
-        import main
-        if main.game and main.game.state != GameState.PLAYING:
+        if game_state.game and game_state.game.state != GameState.PLAYING:
             return
 
         if not self.target or not self.target.is_alive:
@@ -135,6 +124,19 @@ class Enemy(BaseGameEntity):
         # Update attack cooldown
         self.time_since_attack += time.dt
 
+    def tick(self, dt):
+        """
+        Visual update for an enemy whose AI runs in EnemyManager.
+
+        Managed enemies are skipped by Ursina's per-entity update loop;
+        the manager calls this on the steps their AI tier is due.
+        Override in subclasses.
+
+        Args:
+            dt: Time since this enemy's last tick
+        """
+        pass
+
     def on_idle_start(self):
         """Called when entering idle state. Override in subclasses."""
         pass
@@ -180,13 +182,22 @@ class Enemy(BaseGameEntity):
 
         # Calculate angle to target
         direction = self.target.position - self.position
-        direction.y = 0
 
-        if direction.length() > 0:
-            self.look_at(self.position + direction)
-            # Keep upright
-            self.rotation_x = 0
-            self.rotation_z = 0
+        if direction.x or direction.z:
+            self.face_heading(math.degrees(math.atan2(direction.x, direction.z)))
+
+    def face_heading(self, heading):
+        """
+        Face a compass heading, keeping upright.
+
+        Args:
+            heading: Y rotation in degrees (0 faces +Z)
+        """
+        self.rotation = (0, heading, 0)
+
+    def move_to(self, x, z):
+        """Move on the ground plane, keeping the current height."""
+        self.position = Vec3(x, self.y, z)
 
     def attack(self):
         """Execute attack if cooldown is ready."""
@@ -206,12 +217,11 @@ class Enemy(BaseGameEntity):
             self.target.take_damage(self.damage, source=self)
 
     def take_damage(self, amount, source=None):
-        """Override to update health bar."""
+        """Override to mirror health into the manager (and its health bar)."""
         super().take_damage(amount, source)
 
-        # Update health bar
-        if self.health_bar:
-            self.health_bar.scale_x = self.health_percentage * 0.95
+        if self.manager:
+            self.manager.set_health(self, self.health)
 
         # Flash on damage
         self.blink(color.red, duration=0.1)
@@ -221,16 +231,14 @@ class Enemy(BaseGameEntity):
         self.state = EnemyState.DEAD
         self.collider = None
 
-        # Play death sound
-        Audio('assets/sounds/enemy_death.wav', autoplay=True)
+        if self.manager:
+            self.manager.remove(self)
 
-        # Clean up health bar
-        if self.health_bar_bg:
-            destroy(self.health_bar_bg)
-            self.health_bar_bg = None
+        # Play death sound
+        if game_state.game:
+            game_state.game.sounds.play('enemy_death')
 
         # Notify game
-        import game_state
         if game_state.game:
             game_state.game.on_enemy_killed(self)
 
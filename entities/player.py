@@ -2,8 +2,9 @@
 Player Controller
 First-person player with movement, looking, and shooting.
 """
+import numpy as np
 from ursina import (
-    Entity, camera, mouse, held_keys, time, Vec3, Vec2,
+    Entity, camera, mouse, held_keys, Vec3, Vec2,
     color, raycast, destroy, clamp
 )
 from ursina.prefabs.first_person_controller import FirstPersonController
@@ -16,8 +17,13 @@ from config import (
 class Player(FirstPersonController):
     """First-person player controller with health and weapons."""
 
-    def __init__(self, **kwargs):
+    # Driven by the Game scheduler (look, move, combat) instead of
+    # Ursina's per-entity update loop
+    update = None
+
+    def __init__(self, game=None, **kwargs):
         super().__init__(**kwargs)
+        self.game = game
 
         # Override default settings
         self.speed = PLAYER_SPEED
@@ -44,6 +50,10 @@ class Player(FirstPersonController):
         # Damage feedback
         self.damage_cooldown = 0
 
+        # Ground position at the last two fixed steps, for render interpolation
+        self.sim_position = Vec3(self.x, 0, self.z)
+        self.prev_position = Vec3(self.sim_position)
+
     @property
     def health(self):
         return self._health
@@ -51,6 +61,8 @@ class Player(FirstPersonController):
     @health.setter
     def health(self, value):
         self._health = clamp(value, 0, self._max_health)
+        if self.game and self.game.hud:
+            self.game.hud.set_health(self.health_percentage)
         if self._health <= 0 and self.is_alive:
             self.die()
 
@@ -69,18 +81,31 @@ class Player(FirstPersonController):
             return self.weapons[self.current_weapon_index]
         return None
 
-    def update(self):
-        """Update player each frame."""
+    def look(self, dt):
+        """
+        Input phase: mouse look, once per rendered frame.
+
+        Args:
+            dt: Frame time in seconds (unused; mouse velocity is per frame)
+        """
         if not self.is_alive:
             return
 
-        # Get game state from main module
-        import main
-        if main.game and main.game.state != GameState.PLAYING:
+        self.rotation_y += mouse.velocity[0] * self.mouse_sensitivity[1]
+        self.camera_pivot.rotation_x -= mouse.velocity[1] * self.mouse_sensitivity[0]
+        self.camera_pivot.rotation_x = clamp(self.camera_pivot.rotation_x, -90, 90)
+
+    def move(self, dt):
+        """
+        Movement phase: walk and fall by one simulation step.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        if not self.is_alive:
             return
 
-        # Call parent update for movement
-        super().update()
+        self.prev_position = Vec3(self.sim_position)
 
         # Sprint
         if held_keys['shift']:
@@ -88,22 +113,131 @@ class Player(FirstPersonController):
         else:
             self.speed = PLAYER_SPEED
 
+        self._move(dt)
+        self.sim_position = Vec3(self.x, 0, self.z)
+
+    def combat(self, dt):
+        """
+        Combat phase: weapon cooldown, shooting and damage cooldown.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        if not self.is_alive:
+            return
+
         # Shooting with left mouse button
-        if mouse.left and self.current_weapon:
-            self.current_weapon.try_fire(self)
+        weapon = self.current_weapon
+        if weapon:
+            weapon.fixed_update(dt)
+            if mouse.left:
+                weapon.try_fire(self)
 
         # Update damage cooldown
         if self.damage_cooldown > 0:
-            self.damage_cooldown -= time.dt
+            self.damage_cooldown -= dt
+
+    def _move(self, dt):
+        """FirstPersonController walking and gravity with an explicit dt."""
+        self.direction = Vec3(
+            self.forward * (held_keys['w'] - held_keys['s'])
+            + self.right * (held_keys['d'] - held_keys['a'])
+        ).normalized()
+
+        feet = self.position + Vec3(0, 0.5, 0)
+        head = self.position + Vec3(0, self.height - 0.1, 0)
+        chest = self.position + Vec3(0, 1, 0)
+        probes = (
+            (feet, self.direction), (head, self.direction),
+            (chest, Vec3(1, 0, 0)), (chest, Vec3(-1, 0, 0)),
+            (chest, Vec3(0, 0, 1)), (chest, Vec3(0, 0, -1)),
+        )
+        # Enemies have no colliders; their hitboxes block movement here
+        enemy_blocked = self._enemy_probes(probes) if self.direction != Vec3(0, 0, 0) else [False] * 6
+
+        feet_ray = raycast(feet, self.direction,
+                           traverse_target=self.traverse_target, ignore=self.ignore_list, distance=0.5)
+        head_ray = raycast(head, self.direction,
+                           traverse_target=self.traverse_target, ignore=self.ignore_list, distance=0.5)
+        if not (feet_ray.hit or head_ray.hit or enemy_blocked[0] or enemy_blocked[1]):
+            move_amount = self.direction * dt * self.speed
+
+            # Slide along walls instead of stopping dead
+            for axis, probe, index in ((0, Vec3(1, 0, 0), 2), (2, Vec3(0, 0, 1), 4)):
+                if enemy_blocked[index] or raycast(chest, probe, distance=0.5,
+                                                   traverse_target=self.traverse_target,
+                                                   ignore=self.ignore_list).hit:
+                    move_amount[axis] = min(move_amount[axis], 0)
+                if enemy_blocked[index + 1] or raycast(chest, -probe, distance=0.5,
+                                                       traverse_target=self.traverse_target,
+                                                       ignore=self.ignore_list).hit:
+                    move_amount[axis] = max(move_amount[axis], 0)
+            self.position += move_amount
+
+        if self.gravity:
+            ray = raycast(self.world_position + (0, self.height, 0), self.down,
+                          traverse_target=self.traverse_target, ignore=self.ignore_list)
+
+            if ray.distance <= self.height + 0.1:
+                if not self.grounded:
+                    self.land()
+                self.grounded = True
+                # Walk up slopes, but not walls
+                if ray.world_normal.y > 0.7 and ray.world_point.y - self.world_y < 0.5:
+                    self.y = ray.world_point[1]
+                return
+            self.grounded = False
+
+            # Fall unless on the way up in a jump
+            self.y -= min(self.air_time, ray.distance - 0.05) * dt * 100
+            self.air_time += dt * 0.25 * self.gravity
+
+    def _enemy_probes(self, probes):
+        """
+        Which movement probes run into an enemy, in one hitscan query.
+
+        Args:
+            probes: (origin, direction) pairs, each 0.5 long
+
+        Returns:
+            One bool per probe
+        """
+        if not self.game:
+            return [False] * len(probes)
+        origins = np.array([tuple(origin) for origin, _ in probes], dtype=np.float64)
+        directions = np.array([tuple(direction) for _, direction in probes], dtype=np.float64)
+        return self.game.hitscan.enemies_block(origins, directions, 0.5).tolist()
+
+    def restore_simulated(self):
+        """Put the player back at its simulated position before stepping."""
+        self.x, self.z = self.sim_position.x, self.sim_position.z
+
+    def interpolate(self, alpha):
+        """
+        Render the player between its last two simulated positions.
+
+        Only the ground position is blended; height belongs to gravity and
+        the jump animation.
+
+        Args:
+            alpha: Fraction of a step past the latest simulated state
+        """
+        prev, current = self.prev_position, self.sim_position
+        self.x = prev.x + (current.x - prev.x) * alpha
+        self.z = prev.z + (current.z - prev.z) * alpha
+
+    def teleport(self, position):
+        """Move instantly, with no interpolation from the old position."""
+        self.position = position
+        self.sim_position = Vec3(self.x, 0, self.z)
+        self.prev_position = Vec3(self.sim_position)
 
     def input(self, key):
         """Handle discrete input events."""
         if not self.is_alive:
             return
 
-        # Get game state
-        import main
-        if main.game and main.game.state != GameState.PLAYING:
+        if self.game and self.game.state != GameState.PLAYING:
             return
 
         # Weapon switching with number keys
@@ -149,9 +283,8 @@ class Player(FirstPersonController):
         self.damage_cooldown = 0.1  # Brief invincibility
 
         # Notify HUD
-        import main
-        if main.game and main.game.hud:
-            main.game.hud.on_player_damaged(amount, source)
+        if self.game and self.game.hud:
+            self.game.hud.on_player_damaged(amount, source)
 
     def heal(self, amount):
         """Restore health."""
@@ -165,9 +298,8 @@ class Player(FirstPersonController):
         self.speed = 0
 
         # Trigger game over
-        import main
-        if main.game:
-            main.game.game_over()
+        if self.game:
+            self.game.game_over()
 
     def get_shoot_origin(self):
         """Get the origin point for shooting (camera position)."""
@@ -2,149 +2,328 @@
 Doom-like FPS Game - Main Entry Point
 A first-person shooter with enemies that chase you, shooting mechanics, and health.
 """
+import argparse
+import atexit
+import os
+import time as _time
 from ursina import *
 from config import (
     WINDOW_TITLE, FULLSCREEN, SHOW_FPS,
-    GameState, DEFAULT_LEVEL_SIZE, WALL_HEIGHT
+    GameState, SIMULATION_TICK_RATE, HEADLESS_FRAMES, NAV_BACKGROUND_THREAD,
+    ENEMY_VISIBILITY_CULLING, PROFILER_ENABLED, PROFILER_WINDOW, PROFILER_OVERLAY_KEY,
+    TRACE_ENABLED, TRACE_SECONDS, TRACE_DUMP_KEY, TRACE_DIR
 )
 import game_state
+from core.fixed_timestep import FixedTimestep
+from core.profiler import Profiler
+from core.trace import Tracer
+from core.scheduler import Scheduler, SIMULATION_PHASES
+from systems.enemy_manager import EnemyManager
+from systems.spatial_hash import SpatialHash
+from systems.hitscan import Hitscan
+from systems.line_of_sight import LineOfSight
+from systems.sound_manager import SoundManager
+from systems.separation import Separation
+from systems.visibility import Visibility
+from world.navigation import FlowField
+
+
+def profiled_methods():
+    """
+    Methods timed while the game is profiled, as (class, method name).
+
+    Covers each entity class's per-frame work (Ursina's update() where it
+    still runs, the scheduled systems where it was replaced), the batched
+    systems that took over enemy work, and the occasional spikes a trace
+    capture should show: firing, raycasts, spawning and level building.
+    """
+    from entities.enemy import Enemy
+    from entities.enemies.zombie import Zombie
+    from entities.player import Player
+    from weapons.base_weapon import BaseWeapon
+    from ui.hud import HUD
+    from systems.health_bars import HealthBars
+    from weapons.pistol import Pistol
+
+    return [
+        (Enemy, 'update'), (Enemy, 'tick'), (Zombie, 'update'), (Zombie, 'tick'),
+        (Player, 'look'), (Player, 'move'), (Player, 'combat'), (Player, 'interpolate'),
+        (BaseWeapon, 'fixed_update'), (HUD, 'refresh'),
+        (EnemyManager, 'think'), (EnemyManager, 'move'), (EnemyManager, 'attack'),
+        (EnemyManager, 'animate'), (EnemyManager, 'interpolate'),
+        (Visibility, 'update'), (HealthBars, 'refresh'),
+        (Pistol, 'fire'), (Hitscan, 'trace_many'),
+        (Game, 'spawn_enemies'), (Game, 'create_level'),
+    ]
 
 
 class Game:
     """Main game controller that manages all game systems."""
 
-    def __init__(self):
+    def __init__(self, headless=False):
+        self.headless = headless
         self.state = GameState.MENU
         self.player = None
         self.enemies = []
+        self.spatial_hash = SpatialHash()
+        self.line_of_sight = LineOfSight(self.spatial_hash)
+        # Headless runs build flow fields inline so they stay reproducible
+        self.flow_field = FlowField(background=NAV_BACKGROUND_THREAD and not headless)
+        self.enemy_manager = EnemyManager(
+            spatial_hash=self.spatial_hash,
+            line_of_sight=self.line_of_sight,
+            flow_field=self.flow_field,
+            separation=Separation()
+        )
+        self.hitscan = Hitscan(self.enemy_manager)
+        self.visibility = Visibility(self.enemy_manager, enabled=ENEMY_VISIBILITY_CULLING)
+        self.sounds = SoundManager()
+        self.timestep = FixedTimestep()
+        self.scheduler = Scheduler()
+        self.scheduler.pause()      # Nothing runs until a game starts
+        self.profiler = Profiler(window=PROFILER_WINDOW)
+        self.profiler_overlay = None
+        self.tracer = Tracer()
         self.level_geometry = []
+        self.level_layout = []
+        self.level_stats = None
         self.hud = None
+        self.impacts = None
+        self.health_bars = None
         self.menu = None
         self.score = 0
-
-    def start_game(self):
-        """Initialize and start a new game."""
+        self.kills = 0
+        if PROFILER_ENABLED:
+            self.set_profiling(True)
+        if TRACE_ENABLED:
+            self.set_tracing(True)
+
+    def start_game(self, enemy_count=None):
+        """
+        Initialize and start a new game.
+
+        Args:
+            enemy_count: Number of zombies to spawn (None for the default set)
+        """
         self.state = GameState.PLAYING
         self.score = 0
+        self.kills = 0
+        self.timestep.reset()
 
         # Hide menu if exists
         if self.menu:
             self.menu.hide()
 
+        # Load sound effect voices once, before the first shot
+        self.sounds.preload()
+
+        # Pooled hit sparks
+        if not self.impacts:
+            from systems.particle_system import ImpactEffects
+            self.impacts = ImpactEffects()
+        self.impacts.clear()
+
+        # Enemy health bars, batched in one mesh
+        if not self.health_bars:
+            from systems.health_bars import HealthBars
+            self.health_bars = HealthBars(self.enemy_manager, self.timestep)
+
         # Create level
         self.create_level()
 
         # Create player
         from entities.player import Player
-        self.player = Player()
+        self.player = Player(game=self)
+        # Movement raycasts only need the merged level collider, not the
+        # whole scene graph; enemies block through Hitscan.enemies_block
+        self.player.traverse_target = self.level_geometry[0]
 
         # Create HUD
         from ui.hud import HUD
         self.hud = HUD(self.player)
 
         # Spawn initial enemies
-        self.spawn_enemies()
+        self.spawn_enemies(enemy_count)
+
+        self.schedule_systems()
+        self.scheduler.resume()
 
         # Lock mouse for FPS controls
-        mouse.locked = True
-        mouse.visible = False
+        self.set_mouse_captured(True)
+
+    def schedule_systems(self):
+        """Register this game's systems with the scheduler, in phase order."""
+        scheduler = self.scheduler
+        manager = self.enemy_manager
+        scheduler.clear()
+
+        scheduler.add('input', self.player.look)
+        scheduler.add('ai', self.line_of_sight.begin_step)
+        scheduler.add('ai', manager.think)
+        scheduler.add('movement', self.player.move)
+        scheduler.add('movement', manager.move)
+        scheduler.add('combat', manager.attack)
+        scheduler.add('combat', self.player.combat)
+        scheduler.add('combat', self.resolve_deaths)
+        scheduler.add('animation', manager.animate)
+        scheduler.add('ui', self.health_bars.refresh)
+        scheduler.add('ui', self.hud.refresh)
+
+    def set_profiling(self, enabled):
+        """
+        Start or stop timing phases and systems into self.profiler.
+
+        Methods from profiled_methods() are wrapped only while profiling, so
+        an unprofiled game pays nothing. The scheduler holds bound methods,
+        so a running game's systems are registered again to pick up the
+        change. Query the results with self.profiler.summary(),
+        .latest() or .histogram(label).
+
+        Args:
+            enabled: True to start profiling, False to stop
+        """
+        profiler = self.profiler
+        if enabled == profiler.instrumented:
+            return
+        if enabled:
+            for cls, method_name in profiled_methods():
+                profiler.instrument(cls, method_name)
+        else:
+            profiler.restore()
+        if self.player:
+            self.schedule_systems()
+
+    def toggle_profiler_overlay(self):
+        """Show or hide the on-screen profiler, profiling while it is shown."""
+        if self.headless:
+            return
+        if not self.profiler_overlay:
+            from ui.profiler_overlay import ProfilerOverlay
+            self.profiler_overlay = ProfilerOverlay(self.profiler)
+            shown = True
+        else:
+            shown = not self.profiler_overlay.enabled
+        self.profiler_overlay.enabled = shown
+        self.set_profiling(self._wants_profiling())
+
+    def _wants_profiling(self):
+        """True while the config, the overlay or a trace capture needs timings."""
+        overlay = self.profiler_overlay
+        return PROFILER_ENABLED or bool(overlay and overlay.enabled) or self.tracer.enabled
+
+    def set_tracing(self, enabled):
+        """
+        Start or stop recording trace events into self.tracer.
+
+        Frames, scheduler phases and every profiled method become begin/end
+        events; methods are wrapped (via set_profiling) only while needed.
+
+        Args:
+            enabled: True to start capturing, False to stop
+        """
+        tracer = self.tracer
+        tracer.enabled = enabled
+        self.profiler.tracer = tracer if enabled else None
+        self.scheduler.tracer = tracer if enabled else None
+        self.set_profiling(self._wants_profiling())
+
+    def dump_trace(self, path=None, seconds=TRACE_SECONDS):
+        """
+        Write the last seconds of the trace capture as Chrome trace-event JSON.
+
+        Args:
+            path: Output file (default: a timestamped file in TRACE_DIR)
+            seconds: Length of the window to write
+
+        Returns:
+            Path written
+        """
+        if path is None:
+            name = _time.strftime('trace_%Y%m%d_%H%M%S.json')
+            path = os.path.join(TRACE_DIR, name)
+        count = self.tracer.dump(path, seconds)
+        print(f"Trace: {count} events from the last {seconds}s written to {path}")
+        return path
+
+    def _profile_frame(self):
+        """
+        Close the previous frame's profile and trace event.
+
+        Runs at the start of update(): Ursina updates entities after the
+        main update function, so the previous frame's entity updates are
+        complete only now.
+        """
+        profiler = self.profiler
+        scheduler = self.scheduler
+        if profiler.tracer:
+            profiler.tracer.end('frame')
+            profiler.tracer.begin('frame')
+        profiler.add('frame', time.dt)
+        for phase, seconds in scheduler.timings.items():
+            profiler.add(f'phase.{phase}', seconds)
+        profiler.end_frame()
+        # Paused frames record zero phase time
+        scheduler.begin_frame()
+
+    def set_mouse_captured(self, captured):
+        """Lock and hide the mouse for FPS controls, or release it for menus."""
+        if self.headless:
+            return
+        mouse.locked = captured
+        mouse.visible = not captured
 
     def create_level(self):
-        """Create the game level with floor and walls."""
+        """Create the game level with floor and walls, merged into one mesh."""
+        from world.level_builder import arena_layout, build_static_level
+
         # Clear existing geometry
         for entity in self.level_geometry:
             destroy(entity)
         self.level_geometry = []
 
-        # Floor
-        floor = Entity(
-            model='plane',
-            scale=DEFAULT_LEVEL_SIZE,
-            color=color.dark_gray,
-            texture='white_cube',
-            texture_scale=(DEFAULT_LEVEL_SIZE, DEFAULT_LEVEL_SIZE),
-            collider='box'
-        )
-        self.level_geometry.append(floor)
-
-        # Ceiling (optional, adds atmosphere)
-        ceiling = Entity(
-            model='plane',
-            scale=DEFAULT_LEVEL_SIZE,
-            y=WALL_HEIGHT,
-            rotation_x=180,
-            color=color.gray,
-            texture='white_cube',
-            texture_scale=(DEFAULT_LEVEL_SIZE, DEFAULT_LEVEL_SIZE)
-        )
-        self.level_geometry.append(ceiling)
-
-        # Walls
-        wall_positions = [
-            {'pos': (0, WALL_HEIGHT/2, DEFAULT_LEVEL_SIZE/2), 'scale': (DEFAULT_LEVEL_SIZE, WALL_HEIGHT, 1)},      # North
-            {'pos': (0, WALL_HEIGHT/2, -DEFAULT_LEVEL_SIZE/2), 'scale': (DEFAULT_LEVEL_SIZE, WALL_HEIGHT, 1)},     # South
-            {'pos': (DEFAULT_LEVEL_SIZE/2, WALL_HEIGHT/2, 0), 'scale': (1, WALL_HEIGHT, DEFAULT_LEVEL_SIZE)},      # East
-            {'pos': (-DEFAULT_LEVEL_SIZE/2, WALL_HEIGHT/2, 0), 'scale': (1, WALL_HEIGHT, DEFAULT_LEVEL_SIZE)},     # West
-        ]
-
-        for wall_data in wall_positions:
-            wall = Entity(
-                model='cube',
-                position=wall_data['pos'],
-                scale=wall_data['scale'],
-                color=color.light_gray,
-                texture='white_cube',
-                texture_scale=(wall_data['scale'][0]/2, wall_data['scale'][1]/2),
-                collider='box'
-            )
-            self.level_geometry.append(wall)
-
-        # Add some pillars for cover
-        pillar_positions = [
-            (-10, 0, 10), (10, 0, 10), (-10, 0, -10), (10, 0, -10),
-            (0, 0, 15), (0, 0, -15), (15, 0, 0), (-15, 0, 0),
-        ]
-
-        for pos in pillar_positions:
-            pillar = Entity(
-                model='cube',
-                position=(pos[0], WALL_HEIGHT/2, pos[2]),
-                scale=(2, WALL_HEIGHT, 2),
-                color=color.brown,
-                collider='box'
-            )
-            self.level_geometry.append(pillar)
-
-    def spawn_enemies(self):
-        """Spawn enemies in the level."""
+        # Floor, ceiling, walls and pillars as one static mesh and collider
+        self.level_layout = arena_layout()
+        level, self.level_stats = build_static_level(self.level_layout)
+        self.level_geometry.append(level)
+        self.hitscan.set_static_geometry(self.level_layout, level)
+        self.line_of_sight.set_static_geometry(self.level_layout)
+        self.visibility.set_static_geometry(self.level_layout)
+        self.flow_field.set_level(self.level_layout)
+
+    def spawn_enemies(self, count=None):
+        """
+        Spawn enemies in the level.
+
+        Args:
+            count: Number of zombies to spawn; None uses the default
+                hand-placed spawn positions
+        """
         from entities.enemies.zombie import Zombie
+        from world.spawn_points import generate_spawn_positions
 
         # Clear existing enemies
+        self.enemy_manager.clear()
         for enemy in self.enemies:
             if enemy:
                 destroy(enemy)
         self.enemies = []
+        self.enemy_manager.target = self.player
 
         # Spawn positions (away from player spawn at 0,0,0)
-        spawn_positions = [
-            (15, 0, 15),
-            (-15, 0, 15),
-            (15, 0, -15),
-            (-15, 0, -15),
-            (0, 0, 20),
-        ]
+        spawn_positions = generate_spawn_positions(count)
 
         for pos in spawn_positions:
             enemy = Zombie(position=pos)
             enemy.target = self.player
             self.enemies.append(enemy)
+            self.enemy_manager.add(enemy)
 
     def pause(self):
         """Pause the game."""
         if self.state == GameState.PLAYING:
             self.state = GameState.PAUSED
-            mouse.locked = False
-            mouse.visible = True
+            self.scheduler.pause()
+            self.set_mouse_captured(False)
             if self.menu:
                 self.menu.show_pause()
 
@@ -152,29 +331,44 @@ class Game:
         """Resume the game from pause."""
         if self.state == GameState.PAUSED:
             self.state = GameState.PLAYING
-            mouse.locked = True
-            mouse.visible = False
+            self.scheduler.resume()
+            self.set_mouse_captured(True)
             if self.menu:
                 self.menu.hide()
 
     def game_over(self):
         """Handle game over state."""
         self.state = GameState.GAME_OVER
-        mouse.locked = False
-        mouse.visible = True
+        self.scheduler.pause()
+        self.set_mouse_captured(False)
         if self.menu:
             self.menu.show_game_over(self.score)
 
+    def unload_level(self):
+        """Destroy level geometry and enemies, and evict shared assets."""
+        from core.asset_cache import AssetCache
+
+        for entity in self.level_geometry:
+            destroy(entity)
+        self.level_geometry = []
+
+        self.enemy_manager.clear()
+        for enemy in self.enemies:
+            if enemy:
+                destroy(enemy)
+        self.enemies = []
+
+        AssetCache.clear()
+
     def restart(self):
         """Restart the game."""
         # Cleanup
         if self.player:
             destroy(self.player)
-        for enemy in self.enemies:
-            if enemy:
-                destroy(enemy)
+        self.unload_level()
         if self.hud:
             self.hud.cleanup()
+            self.hud = None
 
         # Start fresh
         self.start_game()
@@ -184,20 +378,52 @@ class Game:
         application.quit()
 
     def update(self):
-        """Main game update loop."""
-        if self.state != GameState.PLAYING:
+        """
+        Main game update loop.
+
+        Input runs once per frame, the simulation phases once per fixed
+        step, then positions are interpolated and the UI refreshed.
+        """
+        scheduler = self.scheduler
+        if self.profiler.instrumented:
+            self._profile_frame()
+        if scheduler.paused:
             return
 
-        # Remove dead enemies and check for respawn
+        scheduler.begin_frame()
+        scheduler.run(('input',), time.dt)
+
+        steps = self.timestep.advance(time.dt)
+        if steps and self.player:
+            self.player.restore_simulated()
+
+        for _ in range(steps):
+            scheduler.run(SIMULATION_PHASES, self.timestep.step_dt)
+            if scheduler.paused:
+                return
+
+        # Draw between the last two simulated states, visible enemies only
+        alpha = self.timestep.alpha
+        self.visibility.update()
+        self.enemy_manager.interpolate(alpha)
+        if self.player:
+            self.player.interpolate(alpha)
+
+        scheduler.run(('ui',), time.dt)
+
+    def resolve_deaths(self, dt):
+        """Combat phase: drop dead enemies and end the game if the player died."""
         self.enemies = [e for e in self.enemies if e and e.is_alive]
 
-        # Check player death
         if self.player and not self.player.is_alive:
             self.game_over()
 
     def on_enemy_killed(self, enemy):
         """Called when an enemy is killed."""
         self.score += 10
+        self.kills += 1
+        if self.hud:
+            self.hud.set_score(self.score, self.kills)
 
 
 # Global game instance (for backwards compatibility)
@@ -220,12 +446,98 @@ def input(key):
             game_state.game.pause()
         elif game_state.game.state == GameState.PAUSED:
             game_state.game.resume()
+    elif key == PROFILER_OVERLAY_KEY:
+        game_state.game.toggle_profiler_overlay()
+    elif key == TRACE_DUMP_KEY:
+        if game_state.game.tracer.enabled:
+            game_state.game.dump_trace()
+        else:
+            game_state.game.set_tracing(True)
+            print(f"Trace capture started; press {TRACE_DUMP_KEY} again to dump")
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=WINDOW_TITLE)
+    parser.add_argument(
+        '--headless', action='store_true',
+        help='run the simulation with no window and no audio, then exit'
+    )
+    parser.add_argument(
+        '--frames', type=int, default=HEADLESS_FRAMES,
+        help=f'number of fixed-dt frames to simulate (default {HEADLESS_FRAMES})'
+    )
+    parser.add_argument(
+        '--trace', nargs='?', const='', default=None, metavar='PATH',
+        help=f'capture trace events from startup and write the last {TRACE_SECONDS}s '
+             f'as Chrome trace JSON on exit (default: a file in {TRACE_DIR}/)'
+    )
+    return parser.parse_args(argv)
+
+
+def run_headless(frames, trace=None):
+    """
+    Run a game session without a window for a fixed number of frames.
 
+    Every frame advances time.dt by exactly 1 / SIMULATION_TICK_RATE, so
+    runs are comparable regardless of how fast the machine is.
 
-def main():
+    Args:
+        frames: Number of frames to simulate
+        trace: Trace output path ('' for the default), or None to not trace
+    """
+    global game
+
+    from core.headless import create_headless_app, run_frames
+    from world.level_builder import format_level_stats
+    app = create_headless_app()
+
+    game = Game(headless=True)
+    game_state.game = game
+    if trace is not None:
+        game.set_tracing(True)
+
+    # Cold start: level, player, HUD and the first wave of zombies
+    start = _time.perf_counter()
+    game.start_game()
+    startup = _time.perf_counter() - start
+    print(f"Game start (level + first zombies): {startup * 1000:.1f} ms")
+    print(format_level_stats(game.level_stats))
+
+    elapsed = run_frames(app, frames)
+
+    ms_per_frame = elapsed * 1000 / max(1, frames)
+    print(
+        f"Simulated {frames} frames at {SIMULATION_TICK_RATE} Hz "
+        f"in {elapsed:.3f}s ({ms_per_frame:.3f} ms/frame)"
+    )
+    print(
+        f"State: {game.state}, enemies alive: {len(game.enemies)}, "
+        f"score: {game.score}"
+    )
+
+    # Geometry left to draw after mesh LOD switching
+    from core.mesh_lod import geometry_stats
+    from ursina import scene
+    stats = geometry_stats(scene)
+    print(
+        f"Scene: {stats['geom_nodes']} geom nodes, {stats['vertices']} vertices, "
+        f"{stats['triangles']} triangles"
+    )
+
+    if trace is not None:
+        game.dump_trace(trace or None)
+
+
+def main(argv=None):
     """Main entry point."""
     global game
 
+    args = parse_args(argv)
+    if args.headless:
+        run_headless(args.frames, args.trace)
+        return
+
     # Initialize Ursina
     app = Ursina(
         title=WINDOW_TITLE,
@@ -244,6 +556,9 @@ def main():
     # Create game instance and store in game_state
     game = Game()
     game_state.game = game
+    if args.trace is not None:
+        game.set_tracing(True)
+        atexit.register(game.dump_trace, args.trace or None)
 
     # Create menu
     from ui.menu import MainMenu
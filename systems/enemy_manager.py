@@ -0,0 +1,548 @@
+"""
+Enemy Manager
+Structure-of-arrays storage and batched AI for all enemies.
+"""
+import numpy as np
+from config import (
+    ENEMY_SIGHT_REQUIRES_LOS, ENEMY_NOTICE_TIMEOUT, AI_LOD_TIERS, AI_LOD_UNSEEN_INTERVAL, AI_LOD_BEHIND_DOT,
+    HEALTH_BAR_OFFSET_Y, MESH_LOD_LEVELS, MESH_LOD_HYSTERESIS
+)
+from entities.enemy import EnemyState
+from systems.pose_animation import BOB, PITCH, ROLL, YAW
+
+
+# Integer state codes used in the state array
+STATE_IDLE = 0
+STATE_CHASE = 1
+STATE_ATTACK = 2
+
+STATE_NAMES = (EnemyState.IDLE, EnemyState.CHASE, EnemyState.ATTACK)
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+
+class EnemyManager:
+    """
+    Keeps enemy AI data in NumPy arrays and runs the IDLE/CHASE/ATTACK
+    state machine for every enemy in one batched pass per frame.
+
+    Entities stay the source of truth for rendering; the manager writes
+    back positions and headings of moving enemies and fires the
+    on_*_start hooks only for enemies whose state changed.
+
+    AI runs at a level of detail: each enemy is stepped every N frames
+    depending on its distance to the target (AI_LOD_TIERS), with the time
+    it skipped accumulated into its next step. Enemies are staggered by
+    index so each frame does an even share of the far-tier work.
+
+    update() is a fixed simulation step; entity positions are only written
+    by interpolate(), which blends the last two steps for rendering.
+    """
+
+    def __init__(self, capacity=64, spatial_hash=None, line_of_sight=None,
+                 flow_field=None, separation=None, lod_tiers=AI_LOD_TIERS,
+                 mesh_lod_levels=MESH_LOD_LEVELS, mesh_lod_hysteresis=MESH_LOD_HYSTERESIS):
+        self.enemies = []           # index -> enemy entity
+        self.target = None
+        self.spatial_hash = spatial_hash    # Kept in sync with positions
+        self.line_of_sight = line_of_sight  # Gates idle -> chase when set
+        self.flow_field = flow_field        # Steers chasers around obstacles
+        self.separation = separation        # Keeps chasers from stacking up
+        self.lod_distances = np.array([tier[0] for tier in lod_tiers], dtype=np.float64)
+        self.lod_intervals = np.array([tier[1] for tier in lod_tiers], dtype=np.int64)
+        self.mesh_lod_bounds = np.array([level[0] for level in mesh_lod_levels[:-1]], dtype=np.float64)
+        self.mesh_lod_hysteresis = mesh_lod_hysteresis
+        self.frame = 0
+        self.pose_tables = []       # pose_id -> PoseTable
+        self._allocate(capacity)
+
+        # Enemies stepped this step, shared by the phase methods
+        self._no_due = np.zeros(0, dtype=np.intp)
+        self._due = self._no_due
+        self._step_dt = np.zeros(0)
+        self._delta = np.zeros((0, 3))
+
+    def _allocate(self, capacity):
+        """Allocate (or grow) the per-enemy arrays."""
+        old_count = len(self.enemies)
+
+        def grow(old, shape, dtype):
+            new = np.zeros(shape, dtype=dtype)
+            if old is not None:
+                new[:old_count] = old[:old_count]
+            return new
+
+        self.capacity = capacity
+        self.positions = grow(getattr(self, 'positions', None), (capacity, 3), np.float64)
+        self.prev_positions = grow(getattr(self, 'prev_positions', None), (capacity, 3), np.float64)
+        self.render_pending = grow(getattr(self, 'render_pending', None), capacity, bool)
+        self.health = grow(getattr(self, 'health', None), capacity, np.float64)
+        self.states = grow(getattr(self, 'states', None), capacity, np.int8)
+        self.time_since_attack = grow(getattr(self, 'time_since_attack', None), capacity, np.float64)
+        self.speed = grow(getattr(self, 'speed', None), capacity, np.float64)
+        self.attack_range = grow(getattr(self, 'attack_range', None), capacity, np.float64)
+        self.attack_cooldown = grow(getattr(self, 'attack_cooldown', None), capacity, np.float64)
+        self.detection_range = grow(getattr(self, 'detection_range', None), capacity, np.float64)
+        self.half_extents = grow(getattr(self, 'half_extents', None), (capacity, 3), np.float64)
+        self.hitbox_offset_y = grow(getattr(self, 'hitbox_offset_y', None), capacity, np.float64)
+        self.pending_dt = grow(getattr(self, 'pending_dt', None), capacity, np.float64)
+        self.max_health = grow(getattr(self, 'max_health', None), capacity, np.float64)
+        self.bar_height = grow(getattr(self, 'bar_height', None), capacity, np.float64)
+        self.bar_dirty = grow(getattr(self, 'bar_dirty', None), capacity, bool)
+        self.heading = grow(getattr(self, 'heading', None), capacity, np.float64)
+        self.anim_phase = grow(getattr(self, 'anim_phase', None), capacity, np.float64)
+        self.pose_id = grow(getattr(self, 'pose_id', None), capacity, np.int8)
+        self.mesh_lod = grow(getattr(self, 'mesh_lod', None), capacity, np.int8)
+        self.visible = grow(getattr(self, 'visible', None), capacity, bool)
+        self.unseen_time = grow(getattr(self, 'unseen_time', None), capacity, np.float64)
+
+    @property
+    def count(self):
+        """Number of managed enemies."""
+        return len(self.enemies)
+
+    def add(self, enemy):
+        """
+        Start managing an enemy.
+
+        Args:
+            enemy: Enemy entity; its AI is driven by this manager from now on
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        index = self.count
+        self.enemies.append(enemy)
+
+        position = enemy.position
+        self.positions[index] = (position.x, position.y, position.z)
+        self.prev_positions[index] = self.positions[index]
+        self.render_pending[index] = False
+        self.health[index] = enemy.health
+        self.states[index] = STATE_CODES.get(enemy.state, STATE_IDLE)
+        self.time_since_attack[index] = enemy.time_since_attack
+        self.speed[index] = enemy.speed
+        self.attack_range[index] = enemy.attack_range
+        self.attack_cooldown[index] = enemy.attack_cooldown
+        self.detection_range[index] = enemy.detection_range
+        self.half_extents[index] = [s / 2 for s in enemy.hitbox_size]
+        self.hitbox_offset_y[index] = enemy.hitbox_offset_y
+        self.pending_dt[index] = 0
+        self.max_health[index] = enemy.max_health
+        self.bar_height[index] = enemy.model_height + HEALTH_BAR_OFFSET_Y
+        self.bar_dirty[index] = True
+        self.heading[index] = 0
+        self.anim_phase[index] = getattr(enemy, 'walk_cycle', 0)
+        self.pose_id[index] = self._pose_id(getattr(enemy, 'pose_table', None))
+        self.mesh_lod[index] = getattr(enemy, 'mesh_lod', 0) if getattr(enemy, 'lod_nodes', None) else -1
+        self.visible[index] = True
+        self.unseen_time[index] = 0
+
+        # Ursina's per-entity update loop skips managed enemies; tick() runs instead
+        enemy.manager = self
+        enemy.manager_index = index
+        enemy.ignore = True
+
+        if self.spatial_hash is not None:
+            self.spatial_hash.insert(enemy, position.x, position.z)
+
+    def remove(self, enemy):
+        """
+        Stop managing an enemy (swap-remove, O(1)).
+
+        Args:
+            enemy: Enemy entity previously passed to add()
+        """
+        if enemy.manager is not self:
+            return
+
+        index = enemy.manager_index
+        last = self.count - 1
+
+        if index != last:
+            moved = self.enemies[last]
+            self.enemies[index] = moved
+            moved.manager_index = index
+            for array in self._arrays():
+                array[index] = array[last]
+            self.bar_dirty[index] = True    # Its bar slot now shows another enemy
+
+        self.enemies.pop()
+        enemy.manager = None
+        enemy.manager_index = -1
+        enemy.ignore = False
+        enemy.show()
+
+        # Keep the current step's due list valid if an enemy dies mid-step
+        if len(self._due):
+            keep = self._due != index
+            self._due = np.where(self._due[keep] == last, index, self._due[keep])
+            self._step_dt = self._step_dt[keep]
+            self._delta = self._delta[keep]
+
+        if self.spatial_hash is not None:
+            self.spatial_hash.remove(enemy)
+        if self.line_of_sight is not None:
+            self.line_of_sight.forget(enemy)
+
+    def clear(self):
+        """Stop managing all enemies."""
+        for enemy in self.enemies:
+            enemy.manager = None
+            enemy.manager_index = -1
+            enemy.ignore = False
+        self.enemies = []
+        self._due = self._no_due
+
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
+        if self.line_of_sight is not None:
+            self.line_of_sight.clear()
+
+    def _arrays(self):
+        return (
+            self.positions, self.health, self.states, self.time_since_attack,
+            self.speed, self.attack_range, self.attack_cooldown,
+            self.detection_range, self.half_extents, self.hitbox_offset_y,
+            self.pending_dt, self.prev_positions, self.render_pending,
+            self.max_health, self.bar_height, self.bar_dirty,
+            self.heading, self.anim_phase, self.pose_id, self.mesh_lod, self.visible,
+            self.unseen_time,
+        )
+
+    def _pose_id(self, table):
+        """Index of a pose table in pose_tables (registering it), or -1 for None."""
+        if table is None:
+            return -1
+        if table not in self.pose_tables:
+            self.pose_tables.append(table)
+        return self.pose_tables.index(table)
+
+    def set_health(self, enemy, value):
+        """Mirror an enemy's health into the health array."""
+        if enemy.manager is self:
+            self.health[enemy.manager_index] = value
+            self.bar_dirty[enemy.manager_index] = True
+
+    def update(self, dt):
+        """
+        Run a full step: think, move, attack and animate.
+
+        The Game scheduler calls the four parts from their own phases;
+        this runs them back to back.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        self.think(dt)
+        self.move(dt)
+        self.attack(dt)
+        self.animate(dt)
+
+    def think(self, dt):
+        """
+        AI phase: pick the enemies due this step and update their states.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        self._due = self._no_due
+        n = self.count
+        if n == 0:
+            return
+
+        self.frame += 1
+        self.prev_positions[:n] = self.positions[:n]
+        pending = self.pending_dt[:n]
+        pending += dt
+
+        states = self.states[:n]
+        target = self.target
+
+        if not target or not target.is_alive:
+            self._apply_transitions(np.full(n, STATE_IDLE, dtype=np.int8))
+            return
+
+        positions = self.positions[:n]
+        target_pos = target.position
+        delta = np.array((target_pos.x, target_pos.y, target_pos.z)) - positions
+        dist = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+        self._select_mesh_lod(dist)
+
+        # Enemies whose LOD tier is due this step, and the time they skipped
+        due = self._due_indices(delta, dist)
+        step_dt = pending[due]
+        pending[due] = 0
+        delta = delta[due]
+        dist = dist[due]
+
+        # State machine transitions
+        in_range = dist <= self.detection_range[due]
+        due_states = np.where(
+            ~in_range, STATE_IDLE,
+            np.where(dist <= self.attack_range[due], STATE_ATTACK, STATE_CHASE)
+        ).astype(np.int8)
+
+        # Idle enemies only notice a target they can see, or one that has
+        # stayed in range unseen for ENEMY_NOTICE_TIMEOUT
+        if self.line_of_sight is not None and ENEMY_SIGHT_REQUIRES_LOS:
+            unseen_time = self.unseen_time
+            unseen_time[due[~in_range]] = 0
+            noticing = np.nonzero(in_range & (states[due] == STATE_IDLE))[0]
+            if len(noticing):
+                waiting = due[noticing]
+                seen = self.line_of_sight.query_many(
+                    [self.enemies[index] for index in waiting.tolist()],
+                    positions[waiting],
+                    (target_pos.x, target_pos.y, target_pos.z)
+                )
+                unseen_time[waiting] = np.where(seen, 0, unseen_time[waiting] + step_dt[noticing])
+                hidden = ~seen & (unseen_time[waiting] < ENEMY_NOTICE_TIMEOUT)
+                due_states[noticing[hidden]] = STATE_IDLE
+
+        new_states = states.copy()
+        new_states[due] = due_states
+        self._apply_transitions(new_states)
+
+        self._due = due
+        self._step_dt = step_dt
+        self._delta = delta
+
+    def move(self, dt):
+        """
+        Movement phase: walk due chasers toward the target on the ground plane.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        due = self._due
+        chasing = np.nonzero(self.states[due] == STATE_CHASE)[0]
+        if len(chasing) == 0:
+            return
+
+        positions = self.positions[:self.count]
+        target_pos = self.target.position
+        index_of = due[chasing]
+        dx = self._delta[chasing, 0]
+        dz = self._delta[chasing, 2]
+        length = np.hypot(dx, dz)
+        dx = np.divide(dx, length, out=np.zeros_like(length), where=length > 0)
+        dz = np.divide(dz, length, out=np.zeros_like(length), where=length > 0)
+
+        # Follow the shared flow field; straight at the target where it gives no guidance
+        if self.flow_field is not None:
+            self.flow_field.set_target(target_pos.x, target_pos.z)
+            flow = self.flow_field.sample(positions[index_of, 0], positions[index_of, 2])
+            guided = np.any(flow != 0, axis=1)
+            dx = np.where(guided, flow[:, 0], dx)
+            dz = np.where(guided, flow[:, 1], dz)
+
+        # Push away from nearby enemies, then renormalize to walking speed
+        if self.separation is not None:
+            push = self.separation.steer(positions[:, (0, 2)], index_of)
+            dx = dx + push[:, 0]
+            dz = dz + push[:, 1]
+            length = np.hypot(dx, dz)
+            dx = np.divide(dx, length, out=np.zeros_like(length), where=length > 0)
+            dz = np.divide(dz, length, out=np.zeros_like(length), where=length > 0)
+
+        step = self.speed[index_of] * self._step_dt[chasing]
+        positions[index_of, 0] += dx * step
+        positions[index_of, 2] += dz * step
+        self.render_pending[index_of] = True
+
+        # Posed enemies face their heading when animate() writes their pose
+        headings = np.degrees(np.arctan2(dx, dz))
+        self.heading[index_of] = headings
+        posed = (self.pose_id[index_of] >= 0).tolist()
+        enemies = self.enemies
+        spatial_hash = self.spatial_hash
+        for i, index in enumerate(index_of.tolist()):
+            enemy = enemies[index]
+            if not posed[i]:
+                enemy.face_heading(headings[i])
+            if spatial_hash is not None:
+                spatial_hash.move(enemy, positions[index, 0], positions[index, 2])
+
+    def attack(self, dt):
+        """
+        Combat phase: due attackers whose cooldown is ready hit the target.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        n = self.count
+        due = self._due
+        cooldown = self.time_since_attack[:n]
+        ready = due[
+            (self.states[due] == STATE_ATTACK) & (cooldown[due] >= self.attack_cooldown[due])
+        ]
+        for index in ready.tolist():
+            self.enemies[index].perform_attack()
+        cooldown[ready] = 0
+
+        # Update attack cooldowns
+        cooldown += dt
+
+    def animate(self, dt):
+        """
+        Animation phase: animate due enemies at the same rate as their AI.
+
+        Enemies with a pose table are posed in one batch per table; the
+        rest get tick(). Enemies hidden by visibility culling are skipped.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        shown = self.visible[self._due]
+        due, elapsed = self._due[shown], self._step_dt[shown]
+        if len(due) == 0:
+            return
+
+        pose_ids = self.pose_id[due]
+        for pose_id, table in enumerate(self.pose_tables):
+            which = pose_ids == pose_id
+            if which.any():
+                self._pose(table, due[which], elapsed[which])
+
+        enemies = self.enemies
+        ticked = pose_ids < 0
+        for index, step in zip(due[ticked].tolist(), elapsed[ticked].tolist()):
+            enemies[index].tick(step)
+
+    def _pose(self, table, slots, elapsed):
+        """
+        Advance the animation phase of some enemies and write their poses.
+
+        Each enemy gets one setPosHpr call with its bobbed height and
+        heading plus the pose's rotation offsets; interpolate() later
+        moves it along the ground without touching the pose.
+        """
+        states = self.states[slots]
+        phase = table.advance(self.anim_phase[slots], states, elapsed)
+        self.anim_phase[slots] = phase
+        pose = table.sample(phase, states)
+
+        # Ursina rotation (x, y, z) is Panda's HPR (-y, -x, z)
+        positions = self.positions[slots]
+        transforms = np.column_stack((
+            positions[:, 0], positions[:, 1] + pose[:, BOB], positions[:, 2],
+            -(self.heading[slots] + pose[:, YAW]), -pose[:, PITCH], pose[:, ROLL],
+        ))
+        enemies = self.enemies
+        for index, transform in zip(slots.tolist(), transforms.tolist()):
+            enemies[index].setPosHpr(*transform)
+
+    def render_positions(self, alpha):
+        """
+        Positions as drawn this frame, after interpolate().
+
+        Args:
+            alpha: The alpha passed to interpolate()
+
+        Returns:
+            (count, 3) array
+        """
+        n = self.count
+        prev = self.prev_positions[:n]
+        current = self.positions[:n]
+        blended = prev + (current - prev) * alpha
+        return np.where(self.render_pending[:n, None], blended, current)
+
+    def interpolate(self, alpha):
+        """
+        Place moving enemies between their last two simulated positions.
+
+        Args:
+            alpha: Fraction of a step past the latest simulated state
+        """
+        n = self.count
+        # Hidden enemies stay pending and are placed once they are visible again
+        pending = np.nonzero(self.render_pending[:n] & self.visible[:n])[0]
+        if len(pending) == 0:
+            return
+
+        prev = self.prev_positions[pending]
+        current = self.positions[pending]
+        blended = prev + (current - prev) * alpha
+
+        enemies = self.enemies
+        for index, x, z in zip(pending.tolist(), blended[:, 0].tolist(), blended[:, 2].tolist()):
+            enemies[index].move_to(x, z)
+
+        # Keep blending until an enemy is drawn at its latest position
+        self.render_pending[pending] = np.any(blended != current, axis=1)
+        self.bar_dirty[pending] = True
+
+    def _select_mesh_lod(self, dist):
+        """
+        Switch enemies' mesh level of detail by distance to the target.
+
+        Each level boundary has a hysteresis band: an enemy only moves to
+        a coarser level once it is `mesh_lod_hysteresis` past the boundary,
+        and back once it is that far inside, so enemies hovering at a
+        boundary do not flicker between levels.
+
+        Args:
+            dist: (count,) distances to the target
+        """
+        current = self.mesh_lod[:self.count]
+        has_levels = current >= 0
+        if not has_levels.any():
+            return
+
+        past = dist[:, None] - self.mesh_lod_bounds[None, :]
+        finest = np.count_nonzero(past > self.mesh_lod_hysteresis, axis=1)
+        coarsest = np.count_nonzero(past > -self.mesh_lod_hysteresis, axis=1)
+        wanted = np.clip(current, finest, coarsest)
+
+        changed = np.flatnonzero(has_levels & (wanted != current))
+        enemies = self.enemies
+        for index, level in zip(changed.tolist(), wanted[changed].tolist()):
+            enemies[index].set_mesh_lod(level)
+        current[changed] = wanted[changed]
+
+    def _due_indices(self, delta, dist):
+        """
+        Indices of enemies whose AI tier is due this frame.
+
+        Args:
+            delta: (n, 3) offsets from each enemy to the target
+            dist: (n,) distances to the target
+
+        Returns:
+            Sorted index array
+        """
+        n = len(dist)
+        tiers = np.minimum(
+            np.searchsorted(self.lod_distances, dist), len(self.lod_intervals) - 1
+        )
+        intervals = self.lod_intervals[tiers]
+
+        # Beyond the nearest tier, enemies behind the target drop to the unseen rate
+        forward = self.target.forward
+        facing = np.divide(
+            -(delta[:, 0] * forward.x + delta[:, 2] * forward.z), dist,
+            out=np.zeros(n), where=dist > 0
+        )
+        behind = (facing < AI_LOD_BEHIND_DOT) & (tiers > 0)
+        intervals[behind] = np.maximum(intervals[behind], AI_LOD_UNSEEN_INTERVAL)
+
+        # Stagger by index so equal-interval enemies spread over frames
+        return np.nonzero((self.frame + np.arange(n)) % intervals == 0)[0]
+
+    def _apply_transitions(self, new_states):
+        """Store new states and fire hooks only for enemies that changed."""
+        n = len(new_states)
+        changed = np.nonzero(new_states != self.states[:n])[0]
+        self.states[:n] = new_states
+
+        for index in changed.tolist():
+            enemy = self.enemies[index]
+            code = new_states[index]
+            enemy.state = STATE_NAMES[code]
+            if code == STATE_IDLE:
+                enemy.on_idle_start()
+            elif code == STATE_CHASE:
+                enemy.on_chase_start()
+            elif code == STATE_ATTACK:
+                enemy.on_attack_start()
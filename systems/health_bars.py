@@ -0,0 +1,135 @@
+"""
+Health Bars
+Every enemy health bar drawn as camera-facing quads in one dynamic mesh.
+"""
+import numpy as np
+from ursina import Entity, camera, color
+from core.dynamic_mesh import DynamicMesh
+from config import HEALTH_BAR_SIZE, HEALTH_BAR_DRAW_DISTANCE
+
+
+# Fill quad size relative to the background quad
+FILL_SCALE = (0.95, 0.7)
+
+# Corner signs of a quad, in DynamicMesh's vertex order
+CORNERS = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+
+
+class HealthBars(Entity):
+    """
+    Health bars for all managed enemies.
+
+    Each EnemyManager slot owns two quads (background and fill) in one
+    preallocated quad mesh. refresh() rewrites only the slots the manager
+    flagged as moved, damaged or reassigned, plus bars crossing the draw
+    distance or changing visibility; a turn of the camera re-faces every drawn bar in the same
+    vectorized pass. Bars beyond the draw distance or of enemies hidden by
+    visibility culling collapse to nothing.
+    """
+
+    def __init__(self, manager, timestep, capacity=64,
+                 draw_distance=HEALTH_BAR_DRAW_DISTANCE, **kwargs):
+        """
+        Args:
+            manager: EnemyManager whose enemies get bars
+            timestep: FixedTimestep, for the render interpolation alpha
+            capacity: Initial number of bars (grows with the manager)
+            draw_distance: Bars farther than this from the camera are hidden
+        """
+        super().__init__(**kwargs)
+        self.manager = manager
+        self.timestep = timestep
+        self.draw_distance = draw_distance
+        self.drawn = np.zeros(0, dtype=bool)     # Per slot: bar currently visible
+        self._basis = None                       # Camera right/up/back the bars face
+        self._build(capacity)
+
+    def _build(self, capacity):
+        """Create the quad mesh for `capacity` bars."""
+        old = getattr(self, 'mesh', None)
+        self.mesh = DynamicMesh('health_bars', capacity * 2, DynamicMesh.QUADS)
+        self.model = self.mesh.node_path
+        if old:
+            old.node_path.removeNode()
+        self.model.setTwoSided(True)
+        self.model.setLightOff()
+
+        # Quad 2i is the background, 2i + 1 the fill; colors never change
+        colors = self.mesh.vertices[:, 3:7].reshape(capacity, 2, 4, 4)
+        colors[:, 0] = tuple(color.dark_gray)
+        colors[:, 1] = tuple(color.red)
+        self.capacity = capacity
+        self.drawn = np.zeros(capacity, dtype=bool)
+        self.manager.bar_dirty[:self.manager.count] = True
+
+    def refresh(self, dt):
+        """
+        UI phase: rewrite the bars that changed and upload once if any did.
+
+        Runs after the manager's interpolate(), so bars follow enemies as
+        they are drawn.
+        """
+        manager = self.manager
+        n = manager.count
+        if n > self.capacity:
+            self._build(max(n, self.capacity * 2))
+
+        # Bars of slots no longer in use (enemies removed since last frame)
+        stale = np.flatnonzero(self.drawn[n:]) + n
+
+        # Facing: every drawn bar changes when the camera turns
+        basis = np.array((camera.right, camera.up, camera.back), dtype=np.float32)
+        turned = self._basis is None or not np.array_equal(basis, self._basis)
+        self._basis = basis
+
+        positions = manager.render_positions(self.timestep.alpha)
+        offset = positions - np.asarray(camera.world_position, dtype=np.float64)
+        visible = np.einsum('ij,ij->i', offset, offset) <= self.draw_distance ** 2
+        visible &= manager.visible[:n]
+
+        dirty = manager.bar_dirty[:n] & visible
+        dirty |= visible != self.drawn[:n]
+        if turned:
+            dirty |= visible
+        update = np.flatnonzero(dirty)
+        if len(update) == 0 and len(stale) == 0:
+            return
+
+        quads = self.mesh.vertices[:, 0:3].reshape(self.capacity, 2, 4, 3)
+        shown = update[visible[update]]
+        hidden = np.concatenate((update[~visible[update]], stale))
+        quads[hidden] = 0
+        if len(shown):
+            quads[shown] = self._bar_vertices(manager, positions, shown, basis)
+
+        manager.bar_dirty[update] = False
+        self.drawn[:n] = visible
+        self.drawn[n:] = False
+        self.mesh.upload()
+
+    @staticmethod
+    def _bar_vertices(manager, positions, slots, basis):
+        """
+        World-space corners of the bars of some slots.
+
+        Returns:
+            (len(slots), 2, 4, 3) array: background then fill quad
+        """
+        right, up, back = basis
+        width, height = HEALTH_BAR_SIZE
+        fill = np.clip(manager.health[slots] / manager.max_health[slots], 0, 1)
+
+        center = positions[slots].astype(np.float32)
+        center[:, 1] += manager.bar_height[slots]
+
+        # Half sizes per quad: (slots, 2) along right and up
+        half_w = np.stack((np.full(len(slots), width / 2), fill * width * FILL_SCALE[0] / 2), axis=1)
+        half_h = np.array((height / 2, height * FILL_SCALE[1] / 2))[None, :]
+
+        corners = (
+            half_w[:, :, None, None] * CORNERS[None, None, :, 0, None] * right
+            + half_h[:, :, None, None] * CORNERS[None, None, :, 1, None] * up
+        )
+        # Fill sits just in front of the background
+        corners[:, 1] += back * 0.01
+        return center[:, None, None, :] + corners
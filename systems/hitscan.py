@@ -0,0 +1,256 @@
+"""
+Hitscan
+Analytic ray tests against enemy hitboxes and static level boxes.
+"""
+import numpy as np
+from ursina import Vec3
+
+
+def ray_box_distances(origins, directions, mins, maxs, max_distance):
+    """
+    Vectorized slab test of R rays against N axis-aligned boxes.
+
+    Args:
+        origins: (R, 3) ray origins
+        directions: (R, 3) normalized ray directions
+        mins: (N, 3) box minimum corners
+        maxs: (N, 3) box maximum corners
+        max_distance: Rays are clipped to this length
+
+    Returns:
+        (distances, axes): (R, N) entry distances with inf for misses (0 when
+        the origin is inside a box), and (R, N) index of the axis whose slab
+        was entered last, for hit normals
+    """
+    origins = origins[:, None, :]
+    directions = directions[:, None, :]
+    mins = mins[None, :, :]
+    maxs = maxs[None, :, :]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv = 1.0 / directions
+        t1 = (mins - origins) * inv
+        t2 = (maxs - origins) * inv
+
+    t_near = np.minimum(t1, t2)
+    t_far = np.maximum(t1, t2)
+
+    # Rays parallel to a slab hit it everywhere or nowhere
+    parallel = directions == 0
+    if parallel.any():
+        inside = (origins >= mins) & (origins <= maxs)
+        t_near = np.where(parallel, np.where(inside, -np.inf, np.inf), t_near)
+        t_far = np.where(parallel, np.where(inside, np.inf, -np.inf), t_far)
+
+    axes = t_near.argmax(axis=2)
+    t_enter = t_near.max(axis=2)
+    t_exit = t_far.min(axis=2)
+
+    hit = (t_enter <= t_exit) & (t_exit >= 0) & (t_enter <= max_distance)
+    distances = np.where(hit, np.maximum(t_enter, 0), np.inf)
+    return distances, axes
+
+
+def spread_directions(direction, count, spread, rng=None):
+    """
+    Scatter rays uniformly inside a cone around a direction.
+
+    Args:
+        direction: Aim direction (x, y, z)
+        count: Number of rays
+        spread: Cone radius as the tangent of its half-angle
+        rng: Optional numpy Generator
+
+    Returns:
+        (count, 3) array of normalized directions
+    """
+    rng = rng or np.random.default_rng()
+    forward = np.array([direction[0], direction[1], direction[2]], dtype=np.float64)
+    forward /= np.linalg.norm(forward)
+
+    # Orthonormal basis around the aim direction
+    helper = np.array((0.0, 1.0, 0.0)) if abs(forward[1]) < 0.99 else np.array((1.0, 0.0, 0.0))
+    right = np.cross(helper, forward)
+    right /= np.linalg.norm(right)
+    up = np.cross(forward, right)
+
+    # Uniform points on a disc of radius `spread` one unit ahead
+    radius = spread * np.sqrt(rng.random(count))
+    angle = rng.random(count) * (2 * np.pi)
+    directions = (
+        forward
+        + (radius * np.cos(angle))[:, None] * right
+        + (radius * np.sin(angle))[:, None] * up
+    )
+    return directions / np.linalg.norm(directions, axis=1, keepdims=True)
+
+
+class HitInfo:
+    """Ray hit result with the same fields Pistol reads from ursina's raycast."""
+
+    def __init__(self, hit=False, entity=None, world_point=None, distance=np.inf,
+                 world_normal=None):
+        self.hit = hit
+        self.entity = entity
+        self.world_point = world_point
+        self.point = world_point
+        self.distance = distance
+        self.world_normal = world_normal
+        self.normal = world_normal
+
+
+class Hitscan:
+    """
+    Resolves player shots without walking the scene's colliders.
+
+    Enemy hitboxes come straight from the EnemyManager arrays and the level
+    from the precomputed StaticBox layout, so a shot is a couple of NumPy
+    slab tests no matter how many colliders are in the scene.
+    """
+
+    def __init__(self, enemy_manager):
+        self.enemy_manager = enemy_manager
+        self.level_entity = None
+        self.static_mins = np.zeros((0, 3))
+        self.static_maxs = np.zeros((0, 3))
+
+    def set_static_geometry(self, layout, level_entity):
+        """
+        Use a level layout's solid boxes as static occluders.
+
+        Args:
+            layout: List of StaticBox
+            level_entity: Entity reported as the hit entity for level hits
+        """
+        solid = [box for box in layout if box.collides]
+        self.static_mins = np.array([box.min_corner for box in solid], dtype=np.float64).reshape(-1, 3)
+        self.static_maxs = np.array([box.max_corner for box in solid], dtype=np.float64).reshape(-1, 3)
+        self.level_entity = level_entity
+
+    def enemy_bounds(self):
+        """(mins, maxs) of every managed enemy's hitbox."""
+        manager = self.enemy_manager
+        n = manager.count
+        centers = manager.positions[:n].copy()
+        centers[:, 1] += manager.hitbox_offset_y[:n]
+        half = manager.half_extents[:n]
+        return centers - half, centers + half
+
+    def enemies_block(self, origins, directions, max_distance):
+        """
+        Which short probe rays run into a managed enemy's hitbox.
+
+        Enemies have no ursina colliders, so movement probes test their
+        hitboxes here. Only enemies the manager's spatial hash finds near
+        the probes are tested, and a probe starting inside a hitbox is not
+        blocked by it, so overlapping the crowd never traps the player.
+
+        Args:
+            origins: (R, 3) probe origins, close together
+            directions: (R, 3) normalized probe directions
+            max_distance: Probe length
+
+        Returns:
+            (R,) bool array
+        """
+        manager = self.enemy_manager
+        n = manager.count
+        blocked = np.zeros(len(origins), dtype=bool)
+        if n == 0:
+            return blocked
+
+        if manager.spatial_hash is None:
+            slots = np.arange(n)
+        else:
+            # The hash filters enemy centers by distance, so the radius must
+            # reach the farthest probe and then a hitbox's farthest corner
+            x, z = origins[:, 0].mean(), origins[:, 2].mean()
+            offsets = origins[:, (0, 2)] - (x, z)
+            spread = np.hypot(offsets[:, 0], offsets[:, 1]).max()
+            half = manager.half_extents[:n]
+            corner = np.hypot(half[:, 0], half[:, 2]).max()
+            radius = max_distance + spread + corner
+            slots = np.array([enemy.manager_index for enemy in
+                              manager.spatial_hash.query_radius(x, z, radius)], dtype=np.intp)
+            if len(slots) == 0:
+                return blocked
+
+        centers = manager.positions[slots].copy()
+        centers[:, 1] += manager.hitbox_offset_y[slots]
+        half = manager.half_extents[slots]
+        distances, _ = ray_box_distances(origins, directions, centers - half, centers + half, max_distance)
+        return ((distances > 0) & np.isfinite(distances)).any(axis=1)
+
+    def trace(self, origin, direction, max_distance):
+        """
+        Trace one ray against enemies and level geometry.
+
+        Args:
+            origin: Ray origin
+            direction: Ray direction (normalized here)
+            max_distance: Maximum hit distance
+
+        Returns:
+            HitInfo of the closest hit
+        """
+        origins = np.array([[origin[0], origin[1], origin[2]]], dtype=np.float64)
+        directions = np.array([[direction[0], direction[1], direction[2]]], dtype=np.float64)
+        length = np.linalg.norm(directions)
+        if length == 0:
+            return HitInfo()
+        directions /= length
+
+        entities, distances, normals = self.trace_many(origins, directions, max_distance)
+        if entities[0] is None:
+            return HitInfo()
+
+        distance = float(distances[0])
+        point = origins[0] + directions[0] * distance
+        return HitInfo(
+            hit=True,
+            entity=entities[0],
+            world_point=Vec3(*point),
+            distance=distance,
+            world_normal=Vec3(*normals[0])
+        )
+
+    def trace_many(self, origins, directions, max_distance):
+        """
+        Trace a batch of normalized rays in one pass.
+
+        Args:
+            origins: (R, 3) array
+            directions: (R, 3) array of normalized directions
+            max_distance: Maximum hit distance
+
+        Returns:
+            (entities, distances, normals): per-ray hit entity (None for a
+            miss), (R,) hit distances and (R, 3) hit normals
+        """
+        ray_count = len(origins)
+        best = np.full(ray_count, np.inf)
+        best_normal = np.zeros((ray_count, 3))
+        entities = [None] * ray_count
+
+        def resolve(mins, maxs, lookup):
+            if len(mins) == 0:
+                return
+            distances, axes = ray_box_distances(origins, directions, mins, maxs, max_distance)
+            closest = distances.argmin(axis=1)
+            rows = np.arange(ray_count)
+            closest_distance = distances[rows, closest]
+            closer = np.nonzero(closest_distance < best)[0]
+            for ray in closer.tolist():
+                box = closest[ray]
+                best[ray] = closest_distance[ray]
+                axis = axes[ray, box]
+                normal = np.zeros(3)
+                normal[axis] = -np.sign(directions[ray, axis])
+                best_normal[ray] = normal
+                entities[ray] = lookup(box)
+
+        resolve(self.static_mins, self.static_maxs, lambda box: self.level_entity)
+        enemies = self.enemy_manager.enemies
+        resolve(*self.enemy_bounds(), lambda box: enemies[box])
+
+        return entities, best, best_normal
@@ -0,0 +1,138 @@
+"""
+Line of Sight
+Budgeted, cached sight tests against the static level boxes.
+"""
+import numpy as np
+from config import LOS_QUERIES_PER_STEP, LOS_CACHE_TTL, LOS_EYE_HEIGHT
+from systems.hitscan import ray_box_distances
+
+
+class LineOfSight:
+    """
+    Answers "can this enemy see the target?" for many enemies per step.
+
+    Each enemy keeps one cached result for the (enemy cell, target cell)
+    pair it was computed for. A result is reused until either cell changes
+    or it is older than the TTL; only then is it re-tested. At most
+    `budget` tests run per fixed simulation step, oldest results first, and
+    enemies still waiting keep their last known answer, so the cost per
+    step stays bounded however large the crowd is.
+    """
+
+    def __init__(self, spatial_hash, budget=LOS_QUERIES_PER_STEP, ttl=LOS_CACHE_TTL,
+                 eye_height=LOS_EYE_HEIGHT):
+        self.spatial_hash = spatial_hash    # Supplies the cell grid
+        self.budget = budget
+        self.ttl = ttl
+        self.eye_height = eye_height
+        self.mins = np.zeros((0, 3))
+        self.maxs = np.zeros((0, 3))
+        self.time = 0.0
+        self.remaining = budget
+        self.tests = 0                      # Sight tests run since creation
+        self._cache = {}    # enemy -> (enemy cell, target cell, visible, time)
+
+    def set_static_geometry(self, layout):
+        """
+        Use a level layout's solid boxes as occluders and drop cached results.
+
+        Args:
+            layout: List of StaticBox
+        """
+        solid = [box for box in layout if box.collides]
+        self.mins = np.array([box.min_corner for box in solid], dtype=np.float64).reshape(-1, 3)
+        self.maxs = np.array([box.max_corner for box in solid], dtype=np.float64).reshape(-1, 3)
+        self._cache.clear()
+
+    def begin_step(self, dt):
+        """AI phase: advance the cache clock and refill the per-step budget."""
+        self.time += dt
+        self.remaining = self.budget
+
+    def forget(self, enemy):
+        """Drop an enemy's cached result."""
+        self._cache.pop(enemy, None)
+
+    def clear(self):
+        """Drop all cached results."""
+        self._cache.clear()
+
+    def query_many(self, enemies, positions, target_position):
+        """
+        Sight from each enemy to the target.
+
+        Args:
+            enemies: Sequence of enemy entities (cache keys)
+            positions: (M, 3) enemy foot positions
+            target_position: Target foot position (x, y, z)
+
+        Returns:
+            (M,) bool array; enemies over this step's budget get their
+            last known answer (False if never tested)
+        """
+        count = len(enemies)
+        visible = np.zeros(count, dtype=bool)
+        if count == 0:
+            return visible
+
+        cell_index = self.spatial_hash.cell_index
+        target_cell = cell_index(target_position[0], target_position[2])
+        now = self.time
+        expiry = now - self.ttl
+        cache = self._cache
+
+        stale = []      # (cached time, slot) of enemies needing a fresh test
+        for slot, enemy in enumerate(enemies):
+            enemy_cell = cell_index(positions[slot, 0], positions[slot, 2])
+            entry = cache.get(enemy)
+            if entry is None:
+                stale.append((-np.inf, slot))
+                continue
+            visible[slot] = entry[2]
+            if entry[0] != enemy_cell or entry[1] != target_cell or entry[3] < expiry:
+                stale.append((entry[3], slot))
+
+        if not stale or self.remaining <= 0:
+            return visible
+
+        stale.sort(key=lambda item: item[0])
+        slots = np.array([slot for _, slot in stale[:self.remaining]], dtype=np.intp)
+        self.remaining -= len(slots)
+        self.tests += len(slots)
+
+        results = self.test(positions[slots], target_position)
+        visible[slots] = results
+        for slot, result in zip(slots.tolist(), results.tolist()):
+            enemy_cell = cell_index(positions[slot, 0], positions[slot, 2])
+            cache[enemies[slot]] = (enemy_cell, target_cell, result, now)
+
+        return visible
+
+    def test(self, positions, target_position):
+        """
+        Uncached sight test from several positions to one target.
+
+        Args:
+            positions: (M, 3) foot positions
+            target_position: Target foot position (x, y, z)
+
+        Returns:
+            (M,) bool array, True where no static box blocks the sight line
+        """
+        origins = np.array(positions, dtype=np.float64).reshape(-1, 3)
+        origins[:, 1] += self.eye_height
+        target = np.array(
+            (target_position[0], target_position[1] + self.eye_height, target_position[2]),
+            dtype=np.float64
+        )
+
+        delta = target - origins
+        lengths = np.linalg.norm(delta, axis=1)
+        if len(self.mins) == 0:
+            return np.ones(len(origins), dtype=bool)
+
+        directions = delta / np.maximum(lengths, 1e-9)[:, None]
+        distances, _ = ray_box_distances(
+            origins, directions, self.mins, self.maxs, float(lengths.max())
+        )
+        return distances.min(axis=1) >= lengths
@@ -0,0 +1,68 @@
+"""
+Particle System
+Pooled hit-impact sparks drawn as one dynamic point mesh.
+"""
+import numpy as np
+from ursina import Entity, time
+from core.dynamic_mesh import DynamicMesh
+from config import IMPACT_POOL_SIZE, IMPACT_LIFETIME, IMPACT_SIZE, IMPACT_COLOR
+
+
+class ImpactEffects(Entity):
+    """
+    Ring buffer of impact sparks.
+
+    All sparks live in one preallocated point mesh; spawning writes a slot
+    in the ring (reusing the oldest when full) and one vectorized pass per
+    frame ages and fades them. Rapid fire never creates scene nodes.
+    """
+
+    def __init__(self, capacity=IMPACT_POOL_SIZE, lifetime=IMPACT_LIFETIME, **kwargs):
+        super().__init__(**kwargs)
+
+        self.lifetime = lifetime
+        self.mesh = DynamicMesh('impact_effects', capacity, DynamicMesh.POINTS)
+        self.model = self.mesh.node_path
+
+        # World-sized round-ish points that fade out
+        self.model.setRenderModeThickness(IMPACT_SIZE)
+        self.model.setRenderModePerspective(True)
+        self.model.setTransparency(True)
+        self.model.setDepthWrite(False)
+        self.model.setLightOff()
+
+        self.ages = np.full(capacity, np.inf, dtype=np.float32)
+        self.mesh.vertices[:, 3:6] = IMPACT_COLOR
+        self._next = 0
+        self._drawn = False     # Whether the buffer holds any visible spark
+
+    def spawn(self, position):
+        """
+        Show a spark at a world position.
+
+        Args:
+            position: World position (anything with x, y, z)
+        """
+        index = self._next
+        self._next = (index + 1) % len(self.ages)
+        self.mesh.vertices[index, 0:3] = (position[0], position[1], position[2])
+        self.ages[index] = 0
+
+    def update(self):
+        """Age and fade all sparks in one pass."""
+        alive = self.ages < self.lifetime
+        if not alive.any():
+            if self._drawn:
+                self.mesh.vertices[:, 6] = 0
+                self.mesh.upload()
+                self._drawn = False
+            return
+
+        self.ages[alive] += time.dt
+        self.mesh.vertices[:, 6] = np.clip(1 - self.ages / self.lifetime, 0, 1)
+        self.mesh.upload()
+        self._drawn = True
+
+    def clear(self):
+        """Hide all sparks."""
+        self.ages[:] = np.inf
@@ -0,0 +1,65 @@
+"""
+Pose Animation
+Procedural animation curves baked into lookup tables indexed by phase.
+"""
+import numpy as np
+from config import POSE_TABLE_SAMPLES
+
+
+# Pose channels, in table column order
+BOB, PITCH, ROLL, YAW = range(4)
+
+
+class PoseTable:
+    """
+    Per-state pose curves sampled once over a shared phase period.
+
+    A curve maps phase (radians) to (bob, pitch, roll, yaw): height offset
+    in world units and rotation_x / rotation_z / rotation_y offsets in
+    degrees. Each state advances the phase at its own rate, so looking up
+    a pose for any number of enemies is an index computation and a gather
+    instead of trigonometry per enemy.
+    """
+
+    def __init__(self, curves, rates, period=2 * np.pi, samples=POSE_TABLE_SAMPLES):
+        """
+        Args:
+            curves: One function per state code, taking a phase array and
+                returning four arrays (bob, pitch, roll, yaw)
+            rates: Phase advance per second, per state code
+            period: Phase after which every curve repeats
+            samples: Table entries per state
+        """
+        phase = np.arange(samples) * (period / samples)
+        self.table = np.stack([
+            np.stack([np.broadcast_to(channel, phase.shape) for channel in curve(phase)], axis=1)
+            for curve in curves
+        ])                                          # (states, samples, 4)
+        self.rates = np.asarray(rates, dtype=np.float64)
+        self.period = period
+        self.samples = samples
+
+    def advance(self, phase, states, dt):
+        """
+        Phases after dt seconds in the given states, wrapped to the period.
+
+        Args:
+            phase: Current phases (scalar or array)
+            states: State codes (same shape)
+            dt: Elapsed seconds (scalar or same shape)
+        """
+        return np.mod(phase + self.rates[states] * dt, self.period)
+
+    def sample(self, phase, states):
+        """
+        Poses at some phases.
+
+        Args:
+            phase: Phases in [0, period)
+            states: State codes (same shape)
+
+        Returns:
+            Array of shape phase.shape + (4,): bob, pitch, roll, yaw
+        """
+        index = (np.asarray(phase) * (self.samples / self.period)).astype(np.intp)
+        return self.table[states, index % self.samples]
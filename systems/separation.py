@@ -0,0 +1,118 @@
+"""
+Separation
+Boids-style crowd separation backed by a dense neighbour grid.
+"""
+import math
+import numpy as np
+from config import (
+    DEFAULT_LEVEL_SIZE, SEPARATION_RADIUS, SEPARATION_WEIGHT, SEPARATION_CELL_SLOTS
+)
+
+
+class NeighborGrid:
+    """
+    Uniform XZ grid rebuilt from an array of positions in one pass.
+
+    Each cell holds up to `slots` agent indices in a dense (cells, slots)
+    array, so looking up the 3x3 block around many agents is a single
+    fancy-indexing operation. The grid has a one-cell empty border, so
+    neighbour offsets never leave it. Agents beyond a full cell still feel
+    their neighbours but are not seen as neighbours themselves.
+    """
+
+    def __init__(self, level_size=DEFAULT_LEVEL_SIZE, cell_size=SEPARATION_RADIUS,
+                 slots=SEPARATION_CELL_SLOTS):
+        self.cell_size = cell_size
+        self.half_size = level_size / 2
+        self.columns = max(1, math.ceil(level_size / cell_size)) + 2
+        self.slot_count = slots
+        self.slots = np.full((self.columns * self.columns, slots), -1, dtype=np.intp)
+        self.cells = np.zeros(0, dtype=np.intp)
+        self._offsets = np.array([
+            d_row * self.columns + d_col
+            for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)
+        ], dtype=np.intp)
+
+    def cell_index(self, xz):
+        """Flat cell index of (m, 2) positions, clamped inside the border."""
+        coords = ((xz + self.half_size) // self.cell_size).astype(np.intp) + 1
+        np.clip(coords, 1, self.columns - 2, out=coords)
+        return coords[:, 1] * self.columns + coords[:, 0]
+
+    def build(self, xz):
+        """
+        Bucket agents by cell.
+
+        Args:
+            xz: (n, 2) agent positions on the ground plane
+        """
+        self.slots.fill(-1)
+        cells = self.cell_index(xz)
+        self.cells = cells
+        if len(cells) == 0:
+            return
+
+        # Counting sort: rank of each agent within its cell
+        order = np.argsort(cells, kind='stable')
+        sorted_cells = cells[order]
+        rank = np.arange(len(cells)) - np.searchsorted(sorted_cells, sorted_cells)
+        keep = rank < self.slot_count
+        self.slots[sorted_cells[keep], rank[keep]] = order[keep]
+
+    def neighbours(self, query):
+        """
+        Candidate neighbours of agents from the 3x3 block of cells around them.
+
+        Args:
+            query: (m,) agent indices into the positions passed to build()
+
+        Returns:
+            (m, 9 * slots) agent indices, -1 for empty slots
+        """
+        blocks = self.cells[query][:, None] + self._offsets[None, :]
+        return self.slots[blocks].reshape(len(query), -1)
+
+
+class Separation:
+    """Pushes agents away from neighbours closer than a radius."""
+
+    def __init__(self, radius=SEPARATION_RADIUS, weight=SEPARATION_WEIGHT,
+                 level_size=DEFAULT_LEVEL_SIZE, slots=SEPARATION_CELL_SLOTS):
+        self.radius = radius
+        self.weight = weight
+        self.grid = NeighborGrid(level_size, radius, slots)
+
+    def steer(self, xz, query):
+        """
+        Separation push for some agents, considering all agents as neighbours.
+
+        Args:
+            xz: (n, 2) positions of every agent
+            query: (m,) indices of the agents to steer
+
+        Returns:
+            (m, 2) push vectors, already scaled by the weight; each
+            neighbour contributes up to 1 as it approaches distance 0
+        """
+        self.grid.build(xz)
+        candidates = self.grid.neighbours(query)
+
+        # Work only on real (agent, neighbour) pairs; most slots are empty
+        pairs = np.flatnonzero((candidates >= 0) & (candidates != query[:, None]))
+        rows = pairs // candidates.shape[1]
+        others = candidates.ravel()[pairs]
+        x, z = xz[:, 0], xz[:, 1]
+        agents = query[rows]
+        offset_x = x[agents] - x[others]
+        offset_z = z[agents] - z[others]
+        dist = np.hypot(offset_x, offset_z)
+        close = (dist < self.radius) & (dist > 0)
+        rows, offset_x, offset_z, dist = rows[close], offset_x[close], offset_z[close], dist[close]
+
+        # Unit direction away from the neighbour, weighted by how close it is
+        scale = (self.radius - dist) / (self.radius * dist) * self.weight
+        count = len(query)
+        push = np.empty((count, 2))
+        push[:, 0] = np.bincount(rows, weights=offset_x * scale, minlength=count)
+        push[:, 1] = np.bincount(rows, weights=offset_z * scale, minlength=count)
+        return push
@@ -0,0 +1,74 @@
+"""
+Sound Manager
+Preloaded, fixed-size voice pools for sound effects.
+"""
+from config import SOUND_CLIPS, SOUND_VOICES_PER_CLIP
+
+
+class SoundManager:
+    """
+    Plays sound effects from pools of preloaded voices.
+
+    Each clip gets a fixed number of voices (its polyphony cap), loaded
+    once. Voices are handed out round-robin, so the next voice is always
+    the one started longest ago: a free voice when there is one, otherwise
+    the oldest playing voice is stolen. Playing a sound never loads or
+    allocates anything.
+    """
+
+    def __init__(self, clips=None, voices_per_clip=SOUND_VOICES_PER_CLIP):
+        self.clips = dict(clips or SOUND_CLIPS)
+        self.voices_per_clip = voices_per_clip
+        self._pools = {}        # clip name -> list of Audio voices
+        self._next_voice = {}   # clip name -> index of the oldest voice
+
+    def preload(self):
+        """Load every clip into its voice pool (safe to call more than once)."""
+        from ursina import Audio
+
+        for name, path in self.clips.items():
+            if name in self._pools:
+                continue
+            self._pools[name] = [
+                Audio(path, autoplay=False, auto_destroy=False)
+                for _ in range(self.voices_per_clip)
+            ]
+            self._next_voice[name] = 0
+
+    def play(self, name):
+        """
+        Play a clip, stealing the oldest voice if all are busy.
+
+        Args:
+            name: Clip name from SOUND_CLIPS
+        """
+        pool = self._pools.get(name)
+        if pool is None:
+            if name not in self.clips:
+                return
+            self.preload()
+            pool = self._pools[name]
+
+        index = self._next_voice[name]
+        self._next_voice[name] = (index + 1) % len(pool)
+
+        # Audio.stop() destroys the voice unless told not to
+        voice = pool[index]
+        voice.stop(destroy=False)
+        voice.play()
+
+    def stop_all(self):
+        """Stop every voice."""
+        for pool in self._pools.values():
+            for voice in pool:
+                voice.stop(destroy=False)
+
+    def cleanup(self):
+        """Release all voices."""
+        from ursina import destroy
+
+        for pool in self._pools.values():
+            for voice in pool:
+                destroy(voice)
+        self._pools = {}
+        self._next_voice = {}
@@ -0,0 +1,177 @@
+"""
+Spatial Hash
+Uniform grid over the arena floor for neighbour and area queries.
+"""
+import heapq
+import math
+from config import DEFAULT_LEVEL_SIZE, SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Uniform grid on the XZ plane covering the arena.
+
+    Items (enemies, or anything hashable) are inserted with a position and
+    moved incrementally; an item only changes cell lists when it crosses a
+    cell boundary. Positions outside the arena are clamped to the edge cells.
+    """
+
+    def __init__(self, level_size=DEFAULT_LEVEL_SIZE, cell_size=SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.half_size = level_size / 2
+        self.columns = max(1, math.ceil(level_size / cell_size))
+        self.cells = [set() for _ in range(self.columns * self.columns)]
+        self._cell_of = {}      # item -> cell index
+        self._positions = {}    # item -> (x, z)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def cell_coords(self, x, z):
+        """Grid (column, row) of a world position, clamped to the arena."""
+        last = self.columns - 1
+        column = int((x + self.half_size) // self.cell_size)
+        row = int((z + self.half_size) // self.cell_size)
+        return min(max(column, 0), last), min(max(row, 0), last)
+
+    def cell_index(self, x, z):
+        """Flat cell index of a world position."""
+        column, row = self.cell_coords(x, z)
+        return row * self.columns + column
+
+    def insert(self, item, x, z):
+        """Add an item at a position."""
+        if item in self._positions:
+            self.move(item, x, z)
+            return
+        cell = self.cell_index(x, z)
+        self.cells[cell].add(item)
+        self._cell_of[item] = cell
+        self._positions[item] = (x, z)
+
+    def move(self, item, x, z):
+        """Update an item's position, re-bucketing only when its cell changes."""
+        cell = self.cell_index(x, z)
+        old_cell = self._cell_of[item]
+        if cell != old_cell:
+            self.cells[old_cell].discard(item)
+            self.cells[cell].add(item)
+            self._cell_of[item] = cell
+        self._positions[item] = (x, z)
+
+    def remove(self, item):
+        """Remove an item (no-op if absent)."""
+        cell = self._cell_of.pop(item, None)
+        if cell is None:
+            return
+        self.cells[cell].discard(item)
+        del self._positions[item]
+
+    def clear(self):
+        """Remove all items."""
+        for cell in self.cells:
+            cell.clear()
+        self._cell_of.clear()
+        self._positions.clear()
+
+    def position_of(self, item):
+        """Last (x, z) an item was inserted or moved to."""
+        return self._positions[item]
+
+    def _items_in_cell_range(self, min_column, min_row, max_column, max_row):
+        columns = self.columns
+        cells = self.cells
+        for row in range(min_row, max_row + 1):
+            base = row * columns
+            for column in range(min_column, max_column + 1):
+                yield from cells[base + column]
+
+    def query_box(self, min_x, min_z, max_x, max_z):
+        """
+        Items inside an axis-aligned rectangle on the XZ plane.
+
+        Returns:
+            List of items
+        """
+        min_column, min_row = self.cell_coords(min_x, min_z)
+        max_column, max_row = self.cell_coords(max_x, max_z)
+        positions = self._positions
+        result = []
+        for item in self._items_in_cell_range(min_column, min_row, max_column, max_row):
+            x, z = positions[item]
+            if min_x <= x <= max_x and min_z <= z <= max_z:
+                result.append(item)
+        return result
+
+    def query_radius(self, x, z, radius):
+        """
+        Items within a distance of a point on the XZ plane.
+
+        Returns:
+            List of items
+        """
+        min_column, min_row = self.cell_coords(x - radius, z - radius)
+        max_column, max_row = self.cell_coords(x + radius, z + radius)
+        positions = self._positions
+        radius_sq = radius * radius
+        result = []
+        for item in self._items_in_cell_range(min_column, min_row, max_column, max_row):
+            ix, iz = positions[item]
+            dx, dz = ix - x, iz - z
+            if dx * dx + dz * dz <= radius_sq:
+                result.append(item)
+        return result
+
+    def nearest(self, x, z, k=1, max_radius=None):
+        """
+        The k items nearest to a point, closest first.
+
+        Searches outward ring by ring and stops as soon as no unvisited
+        ring can hold anything closer than the current k-th candidate.
+
+        Args:
+            x, z: Query point
+            k: Number of items to return
+            max_radius: Optional distance limit
+
+        Returns:
+            List of (distance, item) tuples
+        """
+        center_column, center_row = self.cell_coords(x, z)
+        positions = self._positions
+        last = self.columns - 1
+        limit_sq = max_radius * max_radius if max_radius is not None else math.inf
+        candidates = []     # max-heap of (-dist_sq, id, item) holding the best k
+
+        for ring in range(self.columns):
+            min_column, max_column = center_column - ring, center_column + ring
+            min_row, max_row = center_row - ring, center_row + ring
+            for row in range(max(min_row, 0), min(max_row, last) + 1):
+                edge_row = row in (min_row, max_row)
+                step = 1 if edge_row else max(1, max_column - min_column)
+                for column in range(min_column, max_column + 1, step):
+                    if not 0 <= column <= last:
+                        continue
+                    for item in self.cells[row * self.columns + column]:
+                        ix, iz = positions[item]
+                        dist_sq = (ix - x) ** 2 + (iz - z) ** 2
+                        if dist_sq > limit_sq:
+                            continue
+                        entry = (-dist_sq, id(item), item)
+                        if len(candidates) < k:
+                            heapq.heappush(candidates, entry)
+                        elif dist_sq < -candidates[0][0]:
+                            heapq.heapreplace(candidates, entry)
+
+            # Anything in ring + 1 is at least ring * cell_size away
+            reach = ring * self.cell_size
+            if len(candidates) == k and -candidates[0][0] <= reach * reach:
+                break
+            if reach * reach > limit_sq:
+                break
+
+        ordered = sorted((-neg_sq, item_id, item) for neg_sq, item_id, item in candidates)
+        return [(math.sqrt(dist_sq), item) for dist_sq, _, item in ordered]
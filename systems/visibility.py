@@ -0,0 +1,132 @@
+"""
+Visibility
+Per-frame occlusion culling of enemies behind pillars and walls.
+"""
+import numpy as np
+from ursina import camera
+from config import OCCLUDER_MIN_HEIGHT, OCCLUSION_MARGIN, NAV_STEP_HEIGHT
+
+
+class Visibility:
+    """
+    Marks managed enemies hidden when the level's full-height boxes block the view.
+
+    Occluders are the solid boxes that stand on the floor and are taller
+    than OCCLUDER_MIN_HEIGHT (pillars and walls). They hide everything
+    behind them at any height, so the test is done top-down in angles
+    around the camera, one comparison per (enemy, occluder) pair.
+
+    Hidden enemies keep their AI but are not drawn, posed, interpolated or
+    given a health bar; only enemies whose visibility changed touch the
+    scene graph.
+    """
+
+    def __init__(self, manager, enabled=True, margin=OCCLUSION_MARGIN):
+        """
+        Args:
+            manager: EnemyManager whose `visible` array this maintains
+            enabled: When False every enemy stays visible
+            margin: Added to each enemy's hitbox half width
+        """
+        self.manager = manager
+        self.enabled = enabled
+        self.margin = margin
+        self.mins = np.zeros((0, 3))
+        self.maxs = np.zeros((0, 3))
+
+    def set_static_geometry(self, layout):
+        """
+        Use a level layout's floor-standing tall boxes as occluders.
+
+        Args:
+            layout: List of StaticBox
+        """
+        occluders = [
+            box for box in layout
+            if box.collides and box.min_corner[1] < NAV_STEP_HEIGHT
+            and box.max_corner[1] - box.min_corner[1] >= OCCLUDER_MIN_HEIGHT
+        ]
+        self.mins = np.array([box.min_corner for box in occluders], dtype=np.float64).reshape(-1, 3)
+        self.maxs = np.array([box.max_corner for box in occluders], dtype=np.float64).reshape(-1, 3)
+
+    def update(self):
+        """Recompute which enemies the camera can see and show/hide the changed ones."""
+        manager = self.manager
+        n = manager.count
+        if n == 0:
+            return
+
+        visible = manager.visible[:n]
+        if not self.enabled or len(self.mins) == 0:
+            seen = np.ones(n, dtype=bool)
+        else:
+            eye = camera.world_position
+            seen = self.test(np.array((eye.x, eye.z)), manager.positions[:n, (0, 2)],
+                             manager.half_extents[:n, 0] + self.margin)
+
+        changed = np.flatnonzero(seen != visible)
+        enemies = manager.enemies
+        for index, shown in zip(changed.tolist(), seen[changed].tolist()):
+            if shown:
+                enemies[index].show()
+            else:
+                enemies[index].hide()
+        visible[:] = seen
+
+    def test(self, eye, xz, half_widths):
+        """
+        Top-down visibility of enemies from an eye position.
+
+        Each occluder casts an angular shadow from the eye: the range of
+        directions its corners span, starting beyond its farthest corner.
+        An enemy is hidden when its whole angular width fits inside one
+        shadow and all of it is farther than that corner. Enemies only partly
+        covered, or covered by two occluders together, stay visible.
+
+        Args:
+            eye: (2,) camera x, z
+            xz: (n, 2) enemy positions
+            half_widths: (n,) enemy half widths
+
+        Returns:
+            (n,) bool array, False where an occluder fully hides the enemy
+        """
+        # Occluder corners relative to the eye: (k, 4, 2)
+        corners = np.stack((
+            self.mins[:, (0, 2)],
+            np.stack((self.maxs[:, 0], self.mins[:, 2]), axis=1),
+            self.maxs[:, (0, 2)],
+            np.stack((self.mins[:, 0], self.maxs[:, 2]), axis=1),
+        ), axis=1) - eye
+        center = (self.mins[:, (0, 2)] + self.maxs[:, (0, 2)]) / 2 - eye
+        center_angle = np.arctan2(center[:, 1], center[:, 0])
+        # Shadow edges as angles from the direction of the box center,
+        # which always lies inside the shadow
+        corner_angle = _wrap(np.arctan2(corners[..., 1], corners[..., 0]) - center_angle[:, None])
+        low = corner_angle.min(axis=1)
+        high = corner_angle.max(axis=1)
+        far = np.hypot(corners[..., 0], corners[..., 1]).max(axis=1)
+
+        # Eye inside or touching an occluder: it hides nothing
+        inside = np.all((eye >= self.mins[:, (0, 2)]) & (eye <= self.maxs[:, (0, 2)]), axis=1)
+        far[inside] = np.inf
+
+        offset = xz - eye
+        dist = np.hypot(offset[:, 0], offset[:, 1])
+        angle = np.arctan2(offset[:, 1], offset[:, 0])
+        spread = np.arcsin(np.clip(half_widths / np.maximum(dist, 1e-9), 0, 1))
+
+        # (n, k): inside the shadow's angle and behind the occluder
+        relative = _wrap(angle[:, None] - center_angle[None, :])
+        nearest = dist - half_widths
+        shadowed = (
+            (relative - spread[:, None] >= low[None, :])
+            & (relative + spread[:, None] <= high[None, :])
+            & (nearest[:, None] > far[None, :])
+        )
+        return ~shadowed.any(axis=1)
+
+
+def _wrap(angle):
+    """Angles wrapped to [-pi, pi)."""
+    return (angle + np.pi) % (2 * np.pi) - np.pi
@@ -0,0 +1,129 @@
+"""
+Glyph Atlas
+Prebuilt digit texture and quad-based number fields for the HUD.
+"""
+import os
+from PIL import Image, ImageDraw, ImageFont
+from ursina import Entity, Mesh, Texture, Text, camera
+
+
+# Characters the atlas can draw
+GLYPHS = '0123456789%'
+
+
+def load_ui_font(size):
+    """
+    Ursina's default Text font for drawing with Pillow.
+
+    Args:
+        size: Font size in pixels
+
+    Returns:
+        ImageFont, or Pillow's built-in font if the file is missing
+    """
+    import ursina
+    path = os.path.join(os.path.dirname(ursina.__file__), 'fonts', Text.default_font)
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+
+class GlyphAtlas:
+    """
+    One texture holding every glyph in a single row of equal cells.
+
+    Built once with Pillow from Ursina's default font, so number fields
+    never go through Text's per-change glyph layout.
+    """
+
+    _shared = None
+
+    def __init__(self, glyphs=GLYPHS, cell_height=64):
+        self.glyphs = glyphs
+        font = load_ui_font(cell_height)
+
+        # Cell width fits the widest glyph
+        boxes = {glyph: font.getbbox(glyph) for glyph in glyphs}
+        self.cell_width = max(right - left for left, _, right, _ in boxes.values()) + 4
+        self.cell_height = cell_height
+
+        image = Image.new('RGBA', (self.cell_width * len(glyphs), cell_height), (255, 255, 255, 0))
+        draw = ImageDraw.Draw(image)
+        for i, glyph in enumerate(glyphs):
+            left, _, right, _ = boxes[glyph]
+            x = i * self.cell_width + (self.cell_width - (right - left)) // 2 - left
+            draw.text((x, cell_height // 2), glyph, font=font, fill=(255, 255, 255, 255), anchor='lm')
+
+        self.texture = Texture(image, filtering='bilinear')
+        self.aspect = self.cell_width / cell_height      # Glyph width / height
+
+    @classmethod
+    def shared(cls):
+        """The atlas shared by every number field (built on first use)."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def uv_rect(self, glyph):
+        """(u0, u1) of a glyph's cell; the cell spans v 0..1."""
+        index = self.glyphs.index(glyph)
+        count = len(self.glyphs)
+        return index / count, (index + 1) / count
+
+
+class NumberText(Entity):
+    """
+    Short numeric label drawn as textured quads from the glyph atlas.
+
+    The mesh is rebuilt only when the text actually changes; setting the
+    same value again costs a string comparison.
+    """
+
+    def __init__(self, text='', max_chars=4, height=Text.size * 2, parent=camera.ui, **kwargs):
+        """
+        Args:
+            text: Initial text (characters from GLYPHS)
+            max_chars: Longest text the field will show
+            height: Glyph height in UI units (matches Text at scale 2)
+            parent: Parent entity
+        """
+        self.atlas = GlyphAtlas.shared()
+        self.max_chars = max_chars
+        self.glyph_height = height
+        self.glyph_width = height * self.atlas.aspect
+
+        super().__init__(
+            parent=parent,
+            model=Mesh(vertices=[], uvs=[], triangles=[], static=False),
+            texture=self.atlas.texture,
+            **kwargs
+        )
+        self.text = None
+        self.set_text(text)
+
+    def set_text(self, text):
+        """Show new text; a no-op when it is unchanged."""
+        text = str(text)[:self.max_chars]
+        if text == self.text:
+            return
+        self.text = text
+
+        # Quads laid out left to right from the top-left corner, like Text
+        vertices, uvs, triangles = [], [], []
+        width, height = self.glyph_width, self.glyph_height
+        for i, glyph in enumerate(text):
+            if glyph not in self.atlas.glyphs:
+                continue
+            x = i * width
+            u0, u1 = self.atlas.uv_rect(glyph)
+            start = len(vertices)
+            vertices.extend(((x, -height, 0), (x + width, -height, 0), (x + width, 0, 0), (x, 0, 0)))
+            uvs.extend(((u0, 0), (u1, 0), (u1, 1), (u0, 1)))
+            triangles.extend((start, start + 1, start + 2, start, start + 2, start + 3))
+
+        mesh = self.model
+        mesh.vertices = vertices
+        mesh.uvs = uvs
+        mesh.triangles = triangles
+        mesh.generate()
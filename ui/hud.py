@@ -2,7 +2,9 @@
 HUD (Heads-Up Display)
 Doom-style status bar at the bottom of the screen.
 """
-from ursina import Entity, Text, camera, color, Button
+from ursina import Entity, color, destroy
+from ui.glyph_atlas import NumberText
+from ui.status_bar import StatusBarLayer, BAR_Y
 
 
 class HUD(Entity):
@@ -12,135 +14,49 @@ class HUD(Entity):
         super().__init__(**kwargs)
         self.player = player
 
-        bar_y = -0.42  # Bottom of screen
+        # Static bar, labels, face and crosshair: one pre-rendered mesh
+        self.status_layer = StatusBarLayer()
 
-        # Main status bar - brown background using Button (proven to work with colors)
-        self.status_bar = Button(
-            parent=camera.ui,
-            model='quad',
-            color=color.brown,
-            scale=(2, 0.14),
-            position=(0, bar_y),
-            z=0.1,
-            highlight_color=color.brown,
-            pressed_color=color.brown
-        )
-
-        # Dark sections
-        dark = color.dark_gray
-
-        # AMMO section
-        Button(
-            parent=camera.ui,
-            model='quad',
-            color=dark,
-            scale=(0.26, 0.11),
-            position=(-0.7, bar_y),
-            z=0,
-            highlight_color=dark,
-            pressed_color=dark
-        )
-
-        # HEALTH section
-        Button(
-            parent=camera.ui,
-            model='quad',
-            color=dark,
-            scale=(0.30, 0.11),
-            position=(-0.33, bar_y),
-            z=0,
-            highlight_color=dark,
-            pressed_color=dark
-        )
-
-        # FACE section - show a simple face icon
-        Button(
-            parent=camera.ui,
-            model='quad',
-            color=dark,
-            scale=(0.13, 0.11),
-            position=(0, bar_y),
-            z=0,
-            highlight_color=dark,
-            pressed_color=dark
-        )
-
-        # Face image
-        Entity(
-            parent=camera.ui,
-            model='quad',
-            texture='assets/models/amir.png',
-            scale=(0.09, 0.09),
-            position=(0, bar_y),
-            z=-0.1
-        )
-
-        # SCORE section
-        Button(
-            parent=camera.ui,
-            model='quad',
-            color=dark,
-            scale=(0.30, 0.11),
-            position=(0.33, bar_y),
-            z=0,
-            highlight_color=dark,
-            pressed_color=dark
-        )
-
-        # KILLS section
-        Button(
-            parent=camera.ui,
-            model='quad',
-            color=dark,
-            scale=(0.26, 0.11),
-            position=(0.7, bar_y),
-            z=0,
-            highlight_color=dark,
-            pressed_color=dark
-        )
-
-        # Text - red values (z=-1 to render in front of buttons)
+        # Numbers - red values (z=-1 to render in front of the bar)
         red = color.red
-        gray = color.light_gray
-
-        # AMMO
-        self.ammo_text = Text(text='50', position=(-0.75, bar_y+0.015), scale=2, color=red, z=-1)
-        Text(text='AMMO', position=(-0.75, bar_y-0.03), scale=0.8, color=gray, z=-1)
-
-        # HEALTH
-        self.health_text = Text(text='100%', position=(-0.38, bar_y+0.015), scale=2, color=red, z=-1)
-        Text(text='HEALTH', position=(-0.40, bar_y-0.03), scale=0.8, color=gray, z=-1)
-
-        # SCORE
-        self.score_text = Text(text='0', position=(0.28, bar_y+0.015), scale=2, color=red, z=-1)
-        Text(text='SCORE', position=(0.27, bar_y-0.03), scale=0.8, color=gray, z=-1)
-
-        # KILLS
-        self.kills_text = Text(text='0', position=(0.65, bar_y+0.015), scale=2, color=red, z=-1)
-        Text(text='KILLS', position=(0.64, bar_y-0.03), scale=0.8, color=gray, z=-1)
-
-        # Crosshair
-        Entity(parent=camera.ui, model='quad', color=color.white, scale=(0.002, 0.02), position=(0,0), z=-1)
-        Entity(parent=camera.ui, model='quad', color=color.white, scale=(0.02, 0.002), position=(0,0), z=-1)
-
-        self.kills = 0
-
-    def update(self):
-        if not self.player:
+        self.ammo_text = NumberText(max_chars=4, position=(-0.75, BAR_Y+0.015), color=red, z=-1)
+        self.health_text = NumberText(max_chars=4, position=(-0.38, BAR_Y+0.015), color=red, z=-1)
+        self.score_text = NumberText(max_chars=6, position=(0.28, BAR_Y+0.015), color=red, z=-1)
+        self.kills_text = NumberText(max_chars=4, position=(0.65, BAR_Y+0.015), color=red, z=-1)
+
+        # Values waiting to be drawn, by field; filled by the set_* events
+        self._dirty = {}
+
+        weapon = player.current_weapon
+        self.set_health(player.health_percentage)
+        self.set_ammo(weapon.ammo_current if weapon else 0)
+        self.set_score(0, 0)
+
+    def set_health(self, percentage):
+        """Player health changed (0..1)."""
+        self._dirty[self.health_text] = f'{int(percentage * 100)}%'
+
+    def set_ammo(self, count):
+        """Equipped weapon's ammo changed."""
+        self._dirty[self.ammo_text] = f'{count}'
+
+    def set_score(self, score, kills):
+        """Score or kill count changed."""
+        self._dirty[self.score_text] = f'{score}'
+        self._dirty[self.kills_text] = f'{kills}'
+
+    def refresh(self, dt):
+        """
+        UI phase: redraw the fields whose values changed (run by the Game scheduler).
+
+        Several changes in one frame are drawn once, and frames with no
+        changes return immediately.
+        """
+        if not self._dirty:
             return
-
-        health_pct = int(self.player.health_percentage * 100)
-        self.health_text.text = f'{health_pct}%'
-
-        weapon = self.player.current_weapon
-        if weapon:
-            self.ammo_text.text = f'{weapon.ammo_current}'
-
-        import game_state
-        if game_state.game:
-            self.score_text.text = f'{game_state.game.score}'
-            self.kills = game_state.game.score // 10
-            self.kills_text.text = f'{self.kills}'
+        for field, text in self._dirty.items():
+            field.set_text(text)
+        self._dirty.clear()
 
     def on_player_damaged(self, amount, source=None):
         pass
@@ -149,4 +65,8 @@ class HUD(Entity):
         pass
 
     def cleanup(self):
-        pass
+        """Destroy the HUD's UI nodes."""
+        for node in (self.status_layer, self.ammo_text, self.health_text,
+                     self.score_text, self.kills_text):
+            destroy(node)
+        destroy(self)
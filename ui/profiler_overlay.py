@@ -0,0 +1,86 @@
+"""
+Profiler Overlay
+Rolling per-phase and per-system frame times drawn under the FPS counter.
+"""
+from ursina import Entity, Text, window, time
+from core.scheduler import PHASES
+from config import PROFILER_OVERLAY_INTERVAL, PROFILER_HISTOGRAM_BINS
+
+
+# Histogram cell characters, from an empty bin to the fullest one
+SHADES = ' .:-=+*#'
+
+
+def format_profile(profiler, bins=PROFILER_HISTOGRAM_BINS):
+    """
+    Profiler statistics as a fixed-width table.
+
+    Rows are the frame, the scheduler phases in run order, then every other
+    label from most to least expensive. Each row shows the last frame, p50,
+    p95 and max in milliseconds, and a histogram of the rolling window from
+    0 to that row's max.
+
+    Args:
+        profiler: Profiler with per-frame samples
+        bins: Histogram cells per row
+
+    Returns:
+        Multi-line string
+    """
+    summary = profiler.summary(percentiles=(50, 95))
+    latest = profiler.latest()
+    fixed = ['frame'] + [f'phase.{phase}' for phase in PHASES]
+    others = sorted((label for label in summary if label not in fixed),
+                    key=lambda label: summary[label]['mean'], reverse=True)
+
+    width = max((len(label) for label in summary), default=5)
+    lines = [f"{'ms':<{width}}{'last':>7}{'p50':>7}{'p95':>7}{'max':>7}  histogram"]
+    for label in fixed + others:
+        stats = summary.get(label)
+        if stats is None:
+            continue
+        counts, _ = profiler.histogram(label, bins)
+        peak = max(counts) or 1
+        cells = ''.join(SHADES[(count * (len(SHADES) - 1) + peak - 1) // peak] for count in counts)
+        lines.append(
+            f"{label:<{width}}{latest.get(label, 0.0):>7.2f}{stats['p50']:>7.2f}"
+            f"{stats['p95']:>7.2f}{stats['max']:>7.2f}  |{cells}|"
+        )
+    return '\n'.join(lines)
+
+
+class ProfilerOverlay(Entity):
+    """
+    On-screen table of a Profiler, right-aligned below window.fps_counter.
+
+    Rebuilding a Text is costly, so the table is redrawn every
+    PROFILER_OVERLAY_INTERVAL seconds instead of every frame, and not at
+    all while the overlay is disabled.
+    """
+
+    def __init__(self, profiler, interval=PROFILER_OVERLAY_INTERVAL, **kwargs):
+        """
+        Args:
+            profiler: Profiler to display
+            interval: Seconds between redraws
+        """
+        super().__init__(parent=window.editor_ui, eternal=True, **kwargs)
+        self.profiler = profiler
+        self.interval = interval
+        self._elapsed = interval    # Draw on the first update
+        self.text = Text(
+            parent=self,
+            font='VeraMono.ttf',
+            origin=(0.5, 0.5),
+            position=(window.top_right.x - 0.01, window.fps_counter.y - 0.03, -999),
+            scale=0.6,
+        )
+
+    def update(self):
+        self._elapsed += time.dt
+        if self._elapsed < self.interval:
+            return
+        self._elapsed = 0
+        self.text.text = format_profile(self.profiler)
+        # Text does not resize its background when the text changes
+        self.text.create_background()
@@ -0,0 +1,153 @@
+"""
+Status Bar
+Static Doom-style bar, labels, face and crosshair baked into one textured mesh.
+"""
+import os
+from PIL import Image, ImageDraw
+from ursina import Entity, Mesh, Texture, camera, color
+from ui.glyph_atlas import load_ui_font
+from config import MODEL_DIR
+
+
+# Vertical center of the bar in UI units
+BAR_Y = -0.42
+
+# Bar background: (center x, width, height)
+BAR_RECT = (0, 2, 0.14)
+
+# Dark sections behind each readout: (center x, width, height)
+SECTION_RECTS = [
+    (-0.7, 0.26, 0.11),     # Ammo
+    (-0.33, 0.30, 0.11),    # Health
+    (0, 0.13, 0.11),        # Face
+    (0.33, 0.30, 0.11),     # Score
+    (0.7, 0.26, 0.11),      # Kills
+]
+
+# Labels under the numbers: (text, left x, top y offset from BAR_Y)
+LABELS = [
+    ('AMMO', -0.75, -0.03),
+    ('HEALTH', -0.40, -0.03),
+    ('SCORE', 0.27, -0.03),
+    ('KILLS', 0.64, -0.03),
+]
+LABEL_HEIGHT = 0.02         # Same as Text at scale 0.8
+
+FACE_TEXTURE = os.path.join(MODEL_DIR, 'amir.png')
+FACE_SIZE = 0.09
+
+CROSSHAIR_SIZE = 0.02
+CROSSHAIR_THICKNESS = 0.002
+
+
+def _rgba(ursina_color):
+    return tuple(int(round(channel * 255)) for channel in ursina_color)
+
+
+class StatusBarLayer(Entity):
+    """
+    Every static HUD element as one mesh with one texture.
+
+    The bar, sections, labels and face are painted into a single image with
+    Pillow; the crosshair is a small cell of the same image drawn as a
+    second quad at the screen center. The image is built once per process
+    and reused across restarts. Nothing here has a collider, so the layer
+    takes no part in mouse picking.
+    """
+
+    _texture = None
+    _layout = None
+
+    def __init__(self, pixels_per_unit=1000, **kwargs):
+        """
+        Args:
+            pixels_per_unit: Texture resolution per UI unit (one screen height)
+        """
+        if StatusBarLayer._texture is None:
+            image, StatusBarLayer._layout = self.render(pixels_per_unit)
+            StatusBarLayer._texture = Texture(image, filtering='bilinear')
+
+        bar_uvs, crosshair_uvs = StatusBarLayer._layout
+        _, bar_width, bar_height = BAR_RECT
+        vertices, uvs, triangles = [], [], []
+        for (x, y, half_width, half_height), (u0, v0, u1, v1) in (
+            ((BAR_RECT[0], BAR_Y, bar_width / 2, bar_height / 2), bar_uvs),
+            ((0, 0, CROSSHAIR_SIZE / 2, CROSSHAIR_SIZE / 2), crosshair_uvs),
+        ):
+            start = len(vertices)
+            vertices.extend((
+                (x - half_width, y - half_height, 0), (x + half_width, y - half_height, 0),
+                (x + half_width, y + half_height, 0), (x - half_width, y + half_height, 0),
+            ))
+            uvs.extend(((u0, v0), (u1, v0), (u1, v1), (u0, v1)))
+            triangles.extend((start, start + 1, start + 2, start, start + 2, start + 3))
+
+        super().__init__(
+            parent=camera.ui,
+            model=Mesh(vertices=vertices, uvs=uvs, triangles=triangles),
+            texture=StatusBarLayer._texture,
+            z=0.1,
+            **kwargs
+        )
+
+    @staticmethod
+    def render(pixels_per_unit):
+        """
+        Paint the static HUD into an image.
+
+        Args:
+            pixels_per_unit: Pixels per UI unit
+
+        Returns:
+            (image, (bar_uvs, crosshair_uvs)); each uv rect is (u0, v0, u1, v1)
+            with v running bottom to top, as Texture flips the image
+        """
+        def px(units):
+            return int(round(units * pixels_per_unit))
+
+        bar_x, bar_width, bar_height = BAR_RECT
+        left, top = bar_x - bar_width / 2, BAR_Y + bar_height / 2
+
+        def to_image(x, y):
+            """UI coordinates to pixel coordinates inside the bar region."""
+            return px(x - left), px(top - y)
+
+        # Crosshair cell sits right of the bar, with a gutter so filtering
+        # never blends the two
+        gutter = 4
+        bar_w, bar_h = px(bar_width), px(bar_height)
+        cross = px(CROSSHAIR_SIZE)
+        width, height = bar_w + gutter + cross, max(bar_h, cross)
+        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+
+        draw.rectangle((0, 0, bar_w - 1, bar_h - 1), fill=_rgba(color.brown))
+        for x, section_width, section_height in SECTION_RECTS:
+            x0, y0 = to_image(x - section_width / 2, BAR_Y + section_height / 2)
+            x1, y1 = to_image(x + section_width / 2, BAR_Y - section_height / 2)
+            draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=_rgba(color.dark_gray))
+
+        try:
+            face = Image.open(FACE_TEXTURE).convert('RGBA').resize((px(FACE_SIZE), px(FACE_SIZE)))
+            image.alpha_composite(face, to_image(-FACE_SIZE / 2, BAR_Y + FACE_SIZE / 2))
+        except OSError as e:
+            print(f"Status bar face not loaded: {e}")
+
+        font = load_ui_font(px(LABEL_HEIGHT))
+        for text, x, y_offset in LABELS:
+            # Text places its first baseline 0.75 of a line below the top
+            x0, y0 = to_image(x, BAR_Y + y_offset)
+            draw.text((x0, y0 + px(LABEL_HEIGHT * 0.75)), text, font=font,
+                      fill=_rgba(color.light_gray), anchor='ls')
+
+        cross_x = bar_w + gutter
+        middle = cross // 2
+        thickness = max(1, px(CROSSHAIR_THICKNESS))
+        low, high = middle - thickness // 2, middle - thickness // 2 + thickness - 1
+        white = _rgba(color.white)
+        draw.rectangle((cross_x + low, 0, cross_x + high, cross - 1), fill=white)
+        draw.rectangle((cross_x, low, cross_x + cross - 1, high), fill=white)
+
+        bar_uvs = (0, 1 - bar_h / height, bar_w / width, 1)
+        crosshair_uvs = (cross_x / width, 1 - cross / height, (cross_x + cross) / width, 1)
+        return image, (bar_uvs, crosshair_uvs)
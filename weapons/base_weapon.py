@@ -2,7 +2,8 @@
 Base Weapon Class
 Abstract weapon interface with fire rate, ammo, and damage.
 """
-from ursina import Entity, time, Vec3, color
+from ursina import Entity, Vec3, color
+import game_state
 
 
 class BaseWeapon(Entity):
@@ -15,6 +16,7 @@ class BaseWeapon(Entity):
         fire_rate=0.5,
         range_distance=100,
         spread=0.01,
+        pellets=1,
         ammo_max=50,
         **kwargs
     ):
@@ -26,13 +28,14 @@ class BaseWeapon(Entity):
         self.fire_rate = fire_rate
         self.range_distance = range_distance
         self.spread = spread
+        self.pellets = pellets
         self.ammo_max = ammo_max
-        self.ammo_current = ammo_max
 
         # State
         self.time_since_fire = fire_rate  # Ready to fire immediately
         self.is_equipped = False
         self.is_reloading = False
+        self.ammo_current = ammo_max
 
         # Muzzle flash placeholder
         self.muzzle_flash = Entity(
@@ -44,9 +47,32 @@ class BaseWeapon(Entity):
             enabled=False
         )
 
-    def update(self):
-        """Update weapon state each frame."""
-        self.time_since_fire += time.dt
+    @property
+    def ammo_current(self):
+        return self._ammo_current
+
+    @ammo_current.setter
+    def ammo_current(self, value):
+        self._ammo_current = value
+        if self.is_equipped:
+            self.notify_ammo()
+
+    def notify_ammo(self):
+        """Tell the HUD this weapon's ammo count."""
+        game = game_state.game
+        if game and game.hud:
+            game.hud.set_ammo(self._ammo_current)
+
+    def fixed_update(self, dt):
+        """
+        Advance the fire cooldown by one simulation step.
+
+        Called by the owning player for the equipped weapon.
+
+        Args:
+            dt: Fixed step length in seconds
+        """
+        self.time_since_fire += dt
 
     def can_fire(self):
         """Check if the weapon can fire."""
@@ -89,6 +115,7 @@ class BaseWeapon(Entity):
         """Equip this weapon (make visible and active)."""
         self.is_equipped = True
         self.enabled = True
+        self.notify_ammo()
 
     def holster(self):
         """Holster this weapon (hide and deactivate)."""
@@ -1,8 +1,10 @@
 """
 Pistol Weapon
-Hitscan weapon with moderate damage and fire rate.
+Hitscan shotgun firing a spread of pellets.
 """
-from ursina import Entity, raycast, camera, Vec3, color, random, Audio
+import numpy as np
+from ursina import Entity, camera, Vec3, color, random
+import game_state
 from weapons.base_weapon import BaseWeapon
 from config import WEAPONS
 
@@ -11,7 +13,7 @@ class Pistol(BaseWeapon):
     """Hitscan shotgun weapon."""
 
     def __init__(self, **kwargs):
-        config = WEAPONS['pistol']
+        config = WEAPONS['shotgun']
 
         super().__init__(
             weapon_name='Shotgun',
@@ -19,6 +21,7 @@ class Pistol(BaseWeapon):
             fire_rate=config['fire_rate'],
             range_distance=config['range'],
             spread=config['spread'],
+            pellets=config['pellets'],
             ammo_max=config['ammo_max'],
             **kwargs
         )
@@ -34,6 +37,8 @@ class Pistol(BaseWeapon):
         self.default_rotation = Vec3(0, 90, 0)
         self.position = self.default_position
 
+        self.rng = np.random.default_rng()
+
     def _load_shotgun_model(self):
         """Load the shotgun GLB model."""
         try:
@@ -84,28 +89,18 @@ class Pistol(BaseWeapon):
 
     def fire(self, owner):
         """
-        Fire a hitscan shot.
+        Fire a spread of hitscan pellets.
 
         Args:
             owner: The entity firing (player)
         """
-        # Play shotgun sound
-        Audio('assets/sounds/shotgun.wav', autoplay=True)
-
-        # Get shoot origin and direction - shoot straight at crosshair
-        origin = owner.get_shoot_origin()
-        direction = owner.get_shoot_direction()
-
-        # Raycast to find hit (no spread for accurate shots)
-        hit_info = raycast(
-            origin=origin,
-            direction=direction,
-            distance=self.range_distance,
-            ignore=[owner, self]
-        )
-
-        if hit_info.hit:
-            self.on_hit(hit_info, owner)
+        # Shots resolve through the running game's Hitscan; with no game
+        # there is nothing to hit
+        game = game_state.game
+        if game:
+            game.sounds.play('shotgun')
+            # Pellets spread around the crosshair
+            self.fire_pellets(owner.get_shoot_origin(), owner.get_shoot_direction(), owner)
 
         # Shotgun recoil - immediate kick then animate back
         # Kick slightly up and forward (towards player)
@@ -116,50 +111,71 @@ class Pistol(BaseWeapon):
         self.animate_position(self.default_position, duration=0.15)
         self.animate_rotation(self.default_rotation, duration=0.18)
 
-    def on_hit(self, hit_info, owner):
+    def fire_pellets(self, origin, direction, owner):
         """
-        Handle hitting something.
+        Trace every pellet in one batched pass and apply damage per target.
 
         Args:
-            hit_info: Raycast hit information
+            origin: Shot origin
+            direction: Aim direction
             owner: The entity that fired
         """
-        # Create hit effect
-        self.create_hit_effect(hit_info.world_point)
+        from systems.hitscan import spread_directions
+
+        directions = spread_directions(direction, self.pellets, self.spread, self.rng)
+        origins = np.tile((origin[0], origin[1], origin[2]), (self.pellets, 1)).astype(np.float64)
+        entities, distances, _ = game_state.game.hitscan.trace_many(
+            origins, directions, self.range_distance
+        )
+
+        # Sum pellet damage per target, keeping the closest pellet's hit point
+        hits = {}   # target -> [damage, distance, point]
+        for pellet, target in enumerate(entities):
+            if target is None:
+                continue
+            point = Vec3(*(origins[pellet] + directions[pellet] * distances[pellet]))
+            self.create_hit_effect(point)
+
+            if not hasattr(target, 'take_damage'):
+                continue
+            entry = hits.get(target)
+            if entry is None:
+                hits[target] = [self.damage, distances[pellet], point]
+            else:
+                entry[0] += self.damage
+                if distances[pellet] < entry[1]:
+                    entry[1], entry[2] = distances[pellet], point
 
-        target = hit_info.entity
+        if hits:
+            self.apply_hits(hits, owner)
 
-        # Apply damage if target has take_damage method
-        if hasattr(target, 'take_damage'):
-            # Play hit sound
-            Audio('assets/sounds/hit.wav', autoplay=True)
+    def apply_hits(self, hits, owner):
+        """
+        Damage each hit target once.
 
-            from systems.combat_system import CombatSystem
+        Args:
+            hits: Dict of target -> [damage, distance, hit point]
+            owner: The entity that fired
+        """
+        # Play hit sound
+        if game_state.game:
+            game_state.game.sounds.play('hit')
+
+        from systems.combat_system import CombatSystem
+        for target, (damage, _, point) in hits.items():
             CombatSystem.apply_damage(
                 target=target,
-                damage=self.damage,
+                damage=damage,
                 source=owner,
-                hit_position=hit_info.world_point
+                hit_position=point
             )
 
-            # Show hit marker on HUD
-            import main
-            if main.game and main.game.hud:
-                main.game.hud.show_hit_marker()
+        # Show hit marker on HUD
+        if game_state.game and game_state.game.hud:
+            game_state.game.hud.show_hit_marker()
 
     def create_hit_effect(self, position):
         """Create a visual effect at the hit position."""
-        from ursina import destroy, invoke
-
-        # Simple hit spark
-        hit_effect = Entity(
-            model='sphere',
-            scale=0.1,
-            position=position,
-            color=color.yellow
-        )
-
-        # Fade out and destroy
-        hit_effect.animate_scale(0, duration=0.2)
-        hit_effect.animate_color(color.clear, duration=0.2)
-        invoke(destroy, hit_effect, delay=0.2)
+        # Simple hit spark from the pooled impact effects
+        if game_state.game and game_state.game.impacts:
+            game_state.game.impacts.spawn(position)
@@ -0,0 +1,173 @@
+"""
+Level Builder
+Arena layout and a build step that merges all static geometry into one mesh.
+"""
+from panda3d.core import CollisionBox, Point3
+from ursina import Entity, Mesh, color
+from ursina.collider import Collider
+from config import DEFAULT_LEVEL_SIZE, WALL_HEIGHT, WALL_THICKNESS
+
+
+# Faces of an axis-aligned box: name -> corner signs (x, y, z) in quad order
+BOX_FACES = {
+    'top':    [(-1, 1, -1), (-1, 1, 1), (1, 1, 1), (1, 1, -1)],
+    'bottom': [(-1, -1, -1), (1, -1, -1), (1, -1, 1), (-1, -1, 1)],
+    'north':  [(-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)],
+    'south':  [(1, -1, -1), (-1, -1, -1), (-1, 1, -1), (1, 1, -1)],
+    'east':   [(1, -1, 1), (1, -1, -1), (1, 1, -1), (1, 1, 1)],
+    'west':   [(-1, -1, -1), (-1, -1, 1), (-1, 1, 1), (-1, 1, -1)],
+}
+QUAD_UVS = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+# UV of a plain white texel in the shared 'white_cube' texture, used as the
+# atlas region for untextured (flat colored) parts
+FLAT_UV = (0.5, 0.5)
+
+
+class StaticBox:
+    """Axis-aligned box of static level geometry."""
+
+    def __init__(self, name, center, size, box_color, texture_scale=None,
+                 faces=None, collides=True):
+        """
+        Args:
+            name: Part name ('floor', 'wall_north', 'pillar', ...)
+            center: World-space center (x, y, z)
+            size: Full extents (x, y, z)
+            box_color: Vertex color
+            texture_scale: (u, v) repeats of the shared texture, or None
+                for a flat colored part
+            faces: Face names to render (default all six)
+            collides: Whether the part is solid
+        """
+        self.name = name
+        self.center = tuple(center)
+        self.size = tuple(size)
+        self.color = box_color
+        self.texture_scale = texture_scale
+        self.faces = faces or list(BOX_FACES)
+        self.collides = collides
+
+    @property
+    def min_corner(self):
+        return tuple(c - s / 2 for c, s in zip(self.center, self.size))
+
+    @property
+    def max_corner(self):
+        return tuple(c + s / 2 for c, s in zip(self.center, self.size))
+
+
+def arena_layout(level_size=DEFAULT_LEVEL_SIZE, wall_height=WALL_HEIGHT):
+    """
+    The arena: floor, ceiling, four walls and eight pillars.
+
+    Returns:
+        List of StaticBox
+    """
+    half = level_size / 2
+    textured = (level_size, level_size)
+
+    layout = [
+        # Floor (thin solid slab whose top face is at y=0)
+        StaticBox('floor', (0, -0.05, 0), (level_size, 0.1, level_size),
+                  color.dark_gray, texture_scale=textured, faces=['top']),
+        # Ceiling (optional, adds atmosphere)
+        StaticBox('ceiling', (0, wall_height, 0), (level_size, 0, level_size),
+                  color.gray, texture_scale=textured, faces=['bottom'],
+                  collides=False),
+    ]
+
+    # Walls
+    walls = [
+        ('wall_north', (0, wall_height / 2, half), (level_size, wall_height, WALL_THICKNESS)),
+        ('wall_south', (0, wall_height / 2, -half), (level_size, wall_height, WALL_THICKNESS)),
+        ('wall_east', (half, wall_height / 2, 0), (WALL_THICKNESS, wall_height, level_size)),
+        ('wall_west', (-half, wall_height / 2, 0), (WALL_THICKNESS, wall_height, level_size)),
+    ]
+    for name, center, size in walls:
+        layout.append(StaticBox(
+            name, center, size, color.light_gray,
+            texture_scale=(size[0] / 2, size[1] / 2)
+        ))
+
+    # Add some pillars for cover
+    pillar_positions = [
+        (-10, 0, 10), (10, 0, 10), (-10, 0, -10), (10, 0, -10),
+        (0, 0, 15), (0, 0, -15), (15, 0, 0), (-15, 0, 0),
+    ]
+    for x, _, z in pillar_positions:
+        layout.append(StaticBox(
+            'pillar', (x, wall_height / 2, z), (2, wall_height, 2), color.brown
+        ))
+
+    return layout
+
+
+def build_static_level(layout):
+    """
+    Merge a layout into a single textured mesh with one collision node.
+
+    All parts share the 'white_cube' texture: textured parts repeat it,
+    flat parts sample a white texel and take their color from the vertex
+    colors, so the whole level is one geom and one draw call.
+
+    Args:
+        layout: List of StaticBox
+
+    Returns:
+        (level Entity, stats dict)
+    """
+    vertices, triangles, uvs, colors = [], [], [], []
+
+    for box in layout:
+        half = [s / 2 for s in box.size]
+        for face in box.faces:
+            start = len(vertices)
+            for (sx, sy, sz), (u, v) in zip(BOX_FACES[face], QUAD_UVS):
+                vertices.append((
+                    box.center[0] + sx * half[0],
+                    box.center[1] + sy * half[1],
+                    box.center[2] + sz * half[2],
+                ))
+                if box.texture_scale:
+                    uvs.append((u * box.texture_scale[0], v * box.texture_scale[1]))
+                else:
+                    uvs.append(FLAT_UV)
+                colors.append(box.color)
+            triangles.extend((start, start + 1, start + 2, start, start + 2, start + 3))
+
+    level = Entity(
+        model=Mesh(vertices=vertices, triangles=triangles, uvs=uvs, colors=colors),
+        texture='white_cube',
+        double_sided=True
+    )
+
+    # One collision node holding a box per solid part
+    solids = [
+        CollisionBox(Point3(*box.min_corner), Point3(*box.max_corner))
+        for box in layout if box.collides
+    ]
+    level.collider = Collider(level, shape=solids)
+
+    stats = {
+        'parts': len(layout),
+        'draw_calls_before': len(layout),
+        'draw_calls_after': sum(
+            path.node().getNumGeoms() for path in level.findAllMatches('**/+GeomNode')
+        ),
+        'collision_nodes_before': sum(1 for box in layout if box.collides),
+        'collision_nodes_after': 1,
+        'collision_solids': len(solids),
+        'vertices': len(vertices),
+    }
+    return level, stats
+
+
+def format_level_stats(stats):
+    """One-line readout of a build's draw-call and collider reduction."""
+    return (
+        f"Level: {stats['parts']} parts, draw calls {stats['draw_calls_before']} -> "
+        f"{stats['draw_calls_after']}, collision nodes "
+        f"{stats['collision_nodes_before']} -> {stats['collision_nodes_after']} "
+        f"({stats['collision_solids']} solids), {stats['vertices']} vertices"
+    )
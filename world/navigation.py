@@ -0,0 +1,213 @@
+"""
+Navigation
+Grid built from the level boxes and a shared flow field toward the player.
+"""
+import math
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from config import (
+    DEFAULT_LEVEL_SIZE, NAV_CELL_SIZE, NAV_AGENT_RADIUS, NAV_STEP_HEIGHT,
+    NAV_BACKGROUND_THREAD
+)
+
+
+# Neighbour offsets (row, column) and their step costs
+NEIGHBOURS = [
+    (-1, 0, 1.0), (1, 0, 1.0), (0, -1, 1.0), (0, 1, 1.0),
+    (-1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)),
+    (1, -1, math.sqrt(2)), (1, 1, math.sqrt(2)),
+]
+
+
+def _shift(array, d_row, d_col, fill):
+    """array shifted so result[r, c] == array[r + d_row, c + d_col]."""
+    rows, columns = array.shape[:2]
+    result = np.full_like(array, fill)
+    src_rows = slice(max(d_row, 0), rows + min(d_row, 0))
+    dst_rows = slice(max(-d_row, 0), rows + min(-d_row, 0))
+    src_cols = slice(max(d_col, 0), columns + min(d_col, 0))
+    dst_cols = slice(max(-d_col, 0), columns + min(-d_col, 0))
+    result[dst_rows, dst_cols] = array[src_rows, src_cols]
+    return result
+
+
+class NavGrid:
+    """Walkable cells of the arena floor on a uniform XZ grid."""
+
+    def __init__(self, layout, level_size=DEFAULT_LEVEL_SIZE, cell_size=NAV_CELL_SIZE,
+                 clearance=NAV_AGENT_RADIUS):
+        """
+        Args:
+            layout: List of StaticBox; solid boxes taller than a step block
+            level_size: Width/depth of the square arena
+            cell_size: World units per cell
+            clearance: Boxes are grown by this much so agents keep off them
+        """
+        self.cell_size = cell_size
+        self.half_size = level_size / 2
+        self.columns = max(1, math.ceil(level_size / cell_size))
+        self.rows = self.columns
+        self.blocked = np.zeros((self.rows, self.columns), dtype=bool)
+
+        # Cell centers, for overlap tests against the boxes
+        centers = (np.arange(self.columns) + 0.5) * cell_size - self.half_size
+        center_x = centers[None, :]
+        center_z = centers[:, None]
+        half_cell = cell_size / 2
+
+        for box in layout:
+            if not box.collides or box.max_corner[1] < NAV_STEP_HEIGHT:
+                continue
+            min_x, _, min_z = box.min_corner
+            max_x, _, max_z = box.max_corner
+            self.blocked |= (
+                (center_x + half_cell > min_x - clearance)
+                & (center_x - half_cell < max_x + clearance)
+                & (center_z + half_cell > min_z - clearance)
+                & (center_z - half_cell < max_z + clearance)
+            )
+
+        # Diagonal moves must not cut a blocked corner
+        free = ~self.blocked
+        self.diagonal_ok = {
+            (d_row, d_col): _shift(free, d_row, 0, False) & _shift(free, 0, d_col, False)
+            for d_row, d_col, _ in NEIGHBOURS if d_row and d_col
+        }
+
+    def cell_of(self, x, z):
+        """
+        Grid (row, column) of world positions, clamped to the grid.
+
+        Args:
+            x, z: Scalars or arrays of world coordinates
+
+        Returns:
+            (rows, columns) as ints or int arrays
+        """
+        column = np.clip(((np.asarray(x) + self.half_size) // self.cell_size).astype(np.intp),
+                         0, self.columns - 1)
+        row = np.clip(((np.asarray(z) + self.half_size) // self.cell_size).astype(np.intp),
+                      0, self.rows - 1)
+        return row, column
+
+    def integration_field(self, goal):
+        """
+        Path cost from every cell to a goal cell.
+
+        Relaxes all cells at once against their eight neighbours until
+        nothing improves (a grid Dijkstra done as whole-array passes).
+
+        Args:
+            goal: (row, column) of the goal cell
+
+        Returns:
+            (rows, columns) float array, inf where the goal is unreachable
+        """
+        free = ~self.blocked
+        cost = np.full((self.rows, self.columns), np.inf)
+        cost[goal] = 0.0
+
+        while True:
+            best = cost.copy()
+            for d_row, d_col, step in NEIGHBOURS:
+                through = _shift(cost, d_row, d_col, np.inf) + step
+                if d_row and d_col:
+                    through[~self.diagonal_ok[(d_row, d_col)]] = np.inf
+                np.minimum(best, through, out=best)
+            best[~free] = np.inf
+            best[goal] = 0.0
+            if np.array_equal(best, cost):
+                return cost
+            cost = best
+
+    def flow_directions(self, cost):
+        """
+        Unit XZ direction from each cell toward its cheapest neighbour.
+
+        Args:
+            cost: Integration field from integration_field()
+
+        Returns:
+            (rows, columns, 2) float array; zero at the goal and in cells
+            with no path
+        """
+        best = cost.copy()
+        directions = np.zeros((self.rows, self.columns, 2))
+        for d_row, d_col, step in NEIGHBOURS:
+            neighbour = _shift(cost, d_row, d_col, np.inf)
+            if d_row and d_col:
+                neighbour[~self.diagonal_ok[(d_row, d_col)]] = np.inf
+            better = neighbour < best
+            best[better] = neighbour[better]
+            directions[better] = (d_col / math.hypot(d_row, d_col), d_row / math.hypot(d_row, d_col))
+        return directions
+
+
+class FlowField:
+    """
+    One flow field toward the player, shared by every enemy.
+
+    The field is rebuilt only when the target enters a new cell, on a
+    background worker when enabled; until the new field is ready enemies
+    keep following the previous one. Sampling is an array lookup per
+    enemy.
+    """
+
+    def __init__(self, background=NAV_BACKGROUND_THREAD):
+        self.grid = None
+        self.directions = None      # (rows, columns, 2), or None before the first build
+        self.goal = None            # Cell of the current (or pending) field
+        self.builds = 0
+        self._executor = ThreadPoolExecutor(max_workers=1) if background else None
+        self._pending = None
+
+    def set_level(self, layout):
+        """Rebuild the walkable grid for a level layout."""
+        self.grid = NavGrid(layout)
+        self.directions = None
+        self.goal = None
+        self._pending = None
+
+    def set_target(self, x, z):
+        """
+        Follow a target position, rebuilding when it changes cell.
+
+        Also swaps in a finished background build.
+        """
+        if self.grid is None:
+            return
+
+        if self._pending is not None and self._pending.done():
+            self.directions = self._pending.result()
+            self._pending = None
+
+        row, column = self.grid.cell_of(x, z)
+        goal = (int(row), int(column))
+        if goal == self.goal or self._pending is not None:
+            return
+
+        self.goal = goal
+        if self._executor is None:
+            self.directions = self._build(self.grid, goal)
+        else:
+            self._pending = self._executor.submit(self._build, self.grid, goal)
+
+    def _build(self, grid, goal):
+        self.builds += 1
+        return grid.flow_directions(grid.integration_field(goal))
+
+    def sample(self, x, z):
+        """
+        Flow directions at world positions.
+
+        Args:
+            x, z: Arrays of world coordinates
+
+        Returns:
+            (m, 2) array of unit (x, z) directions; zero rows mean no
+            guidance (no field yet, goal cell, or unreachable)
+        """
+        if self.directions is None:
+            return np.zeros((len(x), 2))
+        row, column = self.grid.cell_of(x, z)
+        return self.directions[row, column]
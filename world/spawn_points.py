@@ -0,0 +1,49 @@
+"""
+Spawn Points
+Enemy spawn position generation for the arena.
+"""
+import math
+import random
+from config import DEFAULT_LEVEL_SIZE, WALL_THICKNESS
+
+
+# Hand-placed spawn positions (away from player spawn at 0,0,0), off the
+# pillar diagonals so each zombie can see the player from the start
+DEFAULT_SPAWN_POSITIONS = [
+    (18, 0, 8),
+    (-8, 0, 18),
+    (8, 0, -18),
+    (-18, 0, -8),
+    (5, 0, 20),
+]
+
+
+def generate_spawn_positions(count=None, level_size=DEFAULT_LEVEL_SIZE,
+                             min_distance=8, seed=0):
+    """
+    Generate enemy spawn positions inside the arena.
+
+    Args:
+        count: Number of positions; None returns the default hand-placed set
+        level_size: Width/depth of the square arena
+        min_distance: Minimum distance from the player spawn at the origin
+        seed: Random seed so scenarios are reproducible
+
+    Returns:
+        List of (x, y, z) tuples
+    """
+    if count is None:
+        return list(DEFAULT_SPAWN_POSITIONS)
+
+    rng = random.Random(seed)
+    half = level_size / 2 - WALL_THICKNESS * 1.5
+    positions = []
+
+    while len(positions) < count:
+        x = rng.uniform(-half, half)
+        z = rng.uniform(-half, half)
+        if math.hypot(x, z) < min_distance:
+            continue
+        positions.append((x, 0, z))
+
+    return positions